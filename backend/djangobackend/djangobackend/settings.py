@@ -1,6 +1,7 @@
 from pathlib import Path
 import os
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 
 load_dotenv()
@@ -26,6 +27,11 @@ EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = f'Blood Donation App <{os.getenv("EMAIL_HOST_USER")}>'
 
+# Outbound emails are queued in the database and delivered by `manage.py process_email_outbox`.
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_BACKOFF_SECONDS = 30
+EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = 3600
+
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -139,13 +145,73 @@ REST_FRAMEWORK = {
 
 AUTH_USER_MODEL = 'donation.User' 
 
-CACHES = {
-    'default': {
+# OTPs, rate-limit counters and cached results all go through the default cache, so every worker
+# must share it: use 'redis' in production and 'db' or 'file' where Redis is not available.
+# 'locmem' is per process and only suitable for a single-worker development server.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+
+CACHE_BACKENDS = {
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    },
+    'db': {
+        # Create the table with `manage.py createcachetable`.
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'django_cache'),
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / 'cache')),
+    },
+    'locmem': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',
+    },
+}
+
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(f"CACHE_BACKEND must be one of {', '.join(CACHE_BACKENDS)}, got {CACHE_BACKEND!r}")
+
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'djangobackend'),
     }
 }
 
+RATELIMIT_USE_CACHE = 'default'
+
+DONOR_SEARCH_CACHE_TIMEOUT = 300
+TRACKER_SNAPSHOT_CACHE_TIMEOUT = 3600
+# Seconds other workers may keep accepting an admin after it is deactivated.
+ADMIN_AUTH_CACHE_TTL = 30
+# How often each worker pulls new rows from the refresh token blacklist, and fully reloads it.
+TOKEN_BLACKLIST_SYNC_SECONDS = 5
+TOKEN_BLACKLIST_RELOAD_SECONDS = 600
+# Admin bulk actions on more rows than this run as background jobs instead of inside the request.
+ADMIN_BULK_ACTION_SYNC_LIMIT = 200
+# A running bulk action whose worker has not reported progress for this long is resumed by another worker.
+ADMIN_BULK_ACTION_LEASE_SECONDS = 300
+# Open donation requests are cancelled this many hours after creation if nobody answered.
+DONATION_REQUEST_TTL_HOURS = 72
+# Finished donation requests and call logs move to the archive tables after this many days.
+ARCHIVE_AFTER_DAYS = 90
+# Donor confirmation email links stop working after this many seconds; results of used links stay cached this long.
+DONOR_CONFIRMATION_TOKEN_MAX_AGE = 14 * 24 * 3600
+IDEMPOTENCY_CACHE_TIMEOUT = 24 * 3600
+
+# Jobs run by `manage.py run_scheduler` (cron fields: minute hour day-of-month month day-of-week, UTC).
+SCHEDULER_JOBS = [
+    {'name': 'monthly_reset', 'cron': '1 0 1 * *', 'command': 'monthly_reset_job', 'lock_seconds': 900},
+    {'name': 'email_outbox', 'cron': '* * * * *', 'command': 'process_email_outbox', 'args': ['--once']},
+    {'name': 'admin_bulk_actions', 'cron': '* * * * *', 'command': 'process_admin_bulk_actions', 'args': ['--once'], 'lock_seconds': 600},
+    {'name': 'session_cleanup', 'cron': '15 3 * * *', 'command': 'clearsessions'},
+    {'name': 'token_cleanup', 'cron': '30 3 * * *', 'command': 'prune_expired_tokens'},
+    {'name': 'donation_request_expiry', 'cron': '*/15 * * * *', 'command': 'expire_donation_requests'},
+    {'name': 'archive_old_records', 'cron': '0 4 * * *', 'command': 'archive_old_records', 'lock_seconds': 1800},
+]
+
 RATELIMIT_ENABLE = True
 
 BASE_URL = 'http://192.168.100.16:8000'
@@ -158,6 +224,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=90),  
     'ROTATE_REFRESH_TOKENS': True,  
     'BLACKLIST_AFTER_ROTATION': True,  
+    'TOKEN_REFRESH_SERIALIZER': 'donation.serializers.CachedBlacklistTokenRefreshSerializer',
     'UPDATE_LAST_LOGIN': True,  
     
     'ALGORITHM': 'HS256',
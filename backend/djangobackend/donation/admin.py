@@ -2,7 +2,23 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 from django.db.models import Q
-from .models import User, Profile, Admin, MonthlyDonationTracker
+from django.urls import reverse
+from .models import User, Profile, Admin, MonthlyDonationTracker, OutboundEmail, SchedulerLock, AdminBulkAction, DonationRequestTransition, ArchivedDonationRequest, ArchivedCallLog
+
+
+def _apply_bulk_action(modeladmin, request, action, ids, done_message):
+    """Run an account action as set-based queries, or hand a large selection to a background job."""
+    from donation.services import AdminBulkActionService
+
+    stats, job = AdminBulkActionService.submit(action, list(ids), requested_by=str(request.user))
+    if job is None:
+        modeladmin.message_user(request, done_message.format(**stats))
+        return
+    modeladmin.message_user(request, format_html(
+        '{} rows will be processed in the background. <a href="{}">Track progress of job #{}</a>.',
+        job.total, reverse('admin:donation_adminbulkaction_change', args=[job.id]), job.id
+    ))
+
 
 class CustomUserAdmin(UserAdmin):
     list_display = ('email', 'name', 'is_staff', 'user_status', 'date_joined', 'is_verified')  
@@ -34,60 +50,28 @@ class CustomUserAdmin(UserAdmin):
     user_status.short_description = 'Status'
     
     def block_user_account(self, request, queryset):
-        count = 0
-        for user in queryset:
-            if user.is_active and not user.is_staff:
-                user.is_active = False
-                user.save()
-                count += 1
-        
-        self.message_user(request, f'Successfully blocked {count} user accounts.')
+        _apply_bulk_action(
+            self, request, 'block', queryset.values_list('id', flat=True),
+            'Successfully blocked {affected} user accounts.'
+        )
     block_user_account.short_description = "Block selected user accounts (non-staff only)"
     def unblock_user_account(self, request, queryset):
-        from donation.email_config import EmailService
-        from django.utils import timezone
-        
-        count = 0
-        email_count = 0
-        current_month = timezone.now().strftime('%B %Y')
-        
-        for user in queryset:
-            if not user.is_active and not user.is_staff:
-                user.is_active = True
-                user.manual_block_override = True  # Add this line
-                user.save()
-                count += 1
-                
-                try:
-                    success, message = EmailService.send_monthly_unblock_notification(user, current_month)
-                    if success:
-                        email_count += 1
-                except Exception as e:
-                    pass  
-        
-        message = f'Successfully unblocked {count} user accounts with manual override.'
-        if email_count > 0:
-            message += f' Sent {email_count} notification emails.'
-        self.message_user(request, message)
+        _apply_bulk_action(
+            self, request, 'unblock', queryset.values_list('id', flat=True),
+            'Successfully unblocked {affected} user accounts. Queued {queued_emails} notification emails.'
+        )
     unblock_user_account.short_description = "Unblock selected user accounts (non-staff only)"
     
     def delete_user_account(self, request, queryset):
         from django.contrib import messages
         
-        count = 0
-        for user in queryset:
-            if not user.is_staff:  
-                try:
-                    user_email = user.email
-                    user.delete()
-                    count += 1
-                except Exception as e:
-                    messages.error(request, f'Failed to delete user {user.email}: {str(e)}')
-            else:
-                messages.warning(request, f'Cannot delete staff user: {user.email}')
+        for email in queryset.filter(is_staff=True).values_list('email', flat=True):
+            messages.warning(request, f'Cannot delete staff user: {email}')
         
-        if count > 0:
-            self.message_user(request, f'Successfully deleted {count} user accounts.')
+        _apply_bulk_action(
+            self, request, 'delete', queryset.filter(is_staff=False).values_list('id', flat=True),
+            'Successfully deleted {affected} user accounts.'
+        )
     delete_user_account.short_description = "Delete selected user accounts (non-staff only)"
 
 class ProfileAdmin(admin.ModelAdmin):
@@ -118,63 +102,24 @@ class ProfileAdmin(admin.ModelAdmin):
     user_status.short_description = 'Account Status'
     
     def block_user_account(self, request, queryset):
-        count = 0
-        for profile in queryset:
-            user = profile.user
-            if user.is_active:
-                user.is_active = False
-                user.save()
-                count += 1
-        
-        self.message_user(request, f'Successfully blocked {count} user accounts.')
+        _apply_bulk_action(
+            self, request, 'block', queryset.values_list('user_id', flat=True),
+            'Successfully blocked {affected} user accounts.'
+        )
     block_user_account.short_description = "Block selected user accounts"
     
     def unblock_user_account(self, request, queryset):
-        from donation.email_config import EmailService
-        from django.utils import timezone
-        
-        count = 0
-        email_count = 0
-        current_month = timezone.now().strftime('%B %Y')
-        
-        for profile in queryset:
-            user = profile.user
-            if not user.is_active:
-                user.is_active = True
-                user.save()
-                count += 1
-                
-                
-                try:
-                    success, message = EmailService.send_monthly_unblock_notification(user, current_month)
-                    if success:
-                        email_count += 1
-                except Exception as e:
-                    pass  
-        
-        message = f'Successfully unblocked {count} user accounts.'
-        if email_count > 0:
-            message += f' Sent {email_count} notification emails.'
-        self.message_user(request, message)
+        _apply_bulk_action(
+            self, request, 'unblock', queryset.values_list('user_id', flat=True),
+            'Successfully unblocked {affected} user accounts. Queued {queued_emails} notification emails.'
+        )
     unblock_user_account.short_description = "Unblock selected user accounts"
     
     def delete_user_and_profile(self, request, queryset):
-        
-        from django.contrib import messages
-        
-        count = 0
-        for profile in queryset:
-            user = profile.user
-            try:
-                
-                user_email = user.email
-                user.delete()
-                count += 1
-            except Exception as e:
-                messages.error(request, f'Failed to delete user {user.email}: {str(e)}')
-        
-        if count > 0:
-            self.message_user(request, f'Successfully deleted {count} user profiles and accounts.')
+        _apply_bulk_action(
+            self, request, 'delete', queryset.values_list('user_id', flat=True),
+            'Successfully deleted {affected} user profiles and accounts.'
+        )
     delete_user_and_profile.short_description = "Delete selected user profiles"
 
 class AdminAdmin(admin.ModelAdmin):
@@ -253,16 +198,10 @@ class BlockedProfilesAdmin(admin.ModelAdmin):
         ).select_related('user')
     
     def reset_monthly_count(self, request, queryset):
-        from django.utils import timezone
-        current_month = timezone.now().date().replace(day=1)
-        
-        count = 0
-        for tracker in queryset:
-            if tracker.month == current_month:
-                tracker.reset_for_new_month()
-                count += 1
-        
-        self.message_user(request, f'Successfully reset {count} monthly trackers for current month.')
+        _apply_bulk_action(
+            self, request, 'reset_trackers', queryset.values_list('id', flat=True),
+            'Successfully reset {affected} monthly trackers for current month. Queued {queued_emails} notification emails.'
+        )
     reset_monthly_count.short_description = "Reset monthly count for current month"
     
     def has_add_permission(self, request):
@@ -270,72 +209,124 @@ class BlockedProfilesAdmin(admin.ModelAdmin):
         return False
     
     def block_user_account(self, request, queryset):
-        
-        count = 0
-        for tracker in queryset:
-            user = tracker.user
-            if user.is_active:
-                user.is_active = False
-                user.save()
-                count += 1
-        
-        self.message_user(request, f'Successfully blocked {count} user accounts.')
+        _apply_bulk_action(
+            self, request, 'block', queryset.values_list('user_id', flat=True),
+            'Successfully blocked {affected} user accounts.'
+        )
     block_user_account.short_description = "Block selected user accounts"
     
     def unblock_user_account(self, request, queryset):
-        from donation.email_config import EmailService
-        from django.utils import timezone
-        
-        count = 0
-        email_count = 0
-        current_month = timezone.now().strftime('%B %Y')
-        
-        for tracker in queryset:
-            user = tracker.user
-            if not user.is_active:
-                user.is_active = True
-                user.save()
-                count += 1
-                
-        
-                try:
-                    success, message = EmailService.send_monthly_unblock_notification(user, current_month)
-                    if success:
-                        email_count += 1
-                except Exception as e:
-                    pass  
-        message = f'Successfully unblocked {count} user accounts.'
-        if email_count > 0:
-            message += f' Sent {email_count} notification emails.'
-        self.message_user(request, message)
+        _apply_bulk_action(
+            self, request, 'unblock', queryset.values_list('user_id', flat=True),
+            'Successfully unblocked {affected} user accounts. Queued {queued_emails} notification emails.'
+        )
     unblock_user_account.short_description = "Unblock selected user accounts"
     
     def delete_user_profile(self, request, queryset):
-        
-        from django.contrib import messages
-        
-        count = 0
-        for tracker in queryset:
-            user = tracker.user
-            try:
-                user_email = user.email
-                user.delete()
-                count += 1
-            except Exception as e:
-                messages.error(request, f'Failed to delete user {user.email}: {str(e)}')
-        
-        if count > 0:
-            self.message_user(request, f'Successfully deleted {count} user profiles and accounts.')
+        _apply_bulk_action(
+            self, request, 'delete', queryset.values_list('user_id', flat=True),
+            'Successfully deleted {affected} user profiles and accounts.'
+        )
     delete_user_profile.short_description = "Delete selected user profiles"
     
     def has_delete_permission(self, request, obj=None):
         
         return False
 
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('to_email', 'subject', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('to_email', 'subject')
+    ordering = ('-created_at',)
+    readonly_fields = ('to_email', 'from_email', 'subject', 'body', 'attempts', 'last_error', 'sent_at', 'created_at')
+    actions = ['retry_now']
+    
+    def retry_now(self, request, queryset):
+        from django.utils import timezone
+        count = queryset.exclude(status='sent').update(status='pending', attempts=0, next_attempt_at=timezone.now())
+        self.message_user(request, f'Queued {count} emails for immediate retry.')
+    retry_now.short_description = "Retry selected emails now"
+
+class SchedulerLockAdmin(admin.ModelAdmin):
+    list_display = ('name', 'owner', 'locked_until', 'last_slot', 'last_started_at', 'last_finished_at', 'last_status')
+    readonly_fields = ('name', 'owner', 'locked_until', 'last_slot', 'last_started_at', 'last_finished_at', 'last_status', 'last_error')
+    ordering = ('name',)
+
+class AdminBulkActionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'action', 'status', 'progress', 'affected', 'queued_emails', 'requested_by', 'created_at', 'finished_at')
+    list_filter = ('status', 'action', 'created_at')
+    ordering = ('-created_at',)
+    exclude = ('target_ids',)
+    readonly_fields = ('action', 'status', 'progress', 'total', 'processed', 'affected', 'queued_emails', 'requested_by', 'last_error', 'created_at', 'started_at', 'finished_at', 'claimed_until')
+    actions = ['retry_job']
+    
+    def progress(self, obj):
+        percent = int(obj.processed * 100 / obj.total) if obj.total else 100
+        return format_html(
+            '<progress value="{}" max="100" style="width: 120px;"></progress> {}/{} ({}%)',
+            percent, obj.processed, obj.total, percent
+        )
+    progress.short_description = 'Progress'
+    
+    def retry_job(self, request, queryset):
+        count = queryset.filter(status='failed').update(status='pending', last_error=None, finished_at=None)
+        self.message_user(request, f'Queued {count} failed jobs to resume from their last processed chunk.')
+    retry_job.short_description = "Resume selected failed jobs"
+    
+    def has_add_permission(self, request):
+        return False
+
+class DonationRequestTransitionAdmin(admin.ModelAdmin):
+    list_display = ('donation_request_id', 'event', 'from_status', 'to_status', 'actor', 'created_at')
+    list_filter = ('event', 'to_status', 'created_at')
+    search_fields = ('donation_request__id', 'actor__email')
+    ordering = ('-created_at',)
+    list_select_related = ('actor',)
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+class ArchivedRecordAdmin(admin.ModelAdmin):
+    ordering = ('-id',)
+    
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+class ArchivedDonationRequestAdmin(ArchivedRecordAdmin):
+    list_display = ('id', 'requester', 'donor', 'blood_group', 'status', 'created_at', 'archived_at')
+    list_filter = ('status', 'blood_group', 'archived_at')
+    search_fields = ('requester__email', 'donor__email')
+    list_select_related = ('requester', 'donor')
+
+class ArchivedCallLogAdmin(ArchivedRecordAdmin):
+    list_display = ('id', 'caller', 'receiver', 'call_status', 'donor_email_response', 'created_at', 'archived_at')
+    list_filter = ('call_status', 'donor_email_response', 'archived_at')
+    search_fields = ('caller__email', 'receiver__email')
+    list_select_related = ('caller', 'receiver')
+
+
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(Profile, ProfileAdmin)
 admin.site.register(Admin, AdminAdmin)
 admin.site.register(MonthlyDonationTracker, MonthlyDonationTrackerAdmin)
+admin.site.register(OutboundEmail, OutboundEmailAdmin)
+admin.site.register(SchedulerLock, SchedulerLockAdmin)
+admin.site.register(AdminBulkAction, AdminBulkActionAdmin)
+admin.site.register(DonationRequestTransition, DonationRequestTransitionAdmin)
+admin.site.register(ArchivedDonationRequest, ArchivedDonationRequestAdmin)
+admin.site.register(ArchivedCallLog, ArchivedCallLogAdmin)
 
 class BlockedProfiles(MonthlyDonationTracker):
     class Meta:
@@ -1,83 +1,307 @@
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+import datetime
 import logging
+import smtplib
+import time
 
 logger = logging.getLogger(__name__)
 
 class EmailService:
-    
+
     @staticmethod
-    def send_monthly_unblock_notification(user, month_year):
-        try:
-            subject = f'Account Unblocked - {month_year}'
-            message = f'''
-            Dear {user.name},
-            
+    def queue_email(subject, message, recipient, from_email=None):
+        """Store an email in the outbox; process_email_outbox delivers it outside the request."""
+        from .models import OutboundEmail
+
+        return OutboundEmail.objects.create(
+            to_email=recipient,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            subject=subject,
+            body=message,
+            max_attempts=getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+        )
+
+    @staticmethod
+    def queue_emails(emails):
+        """Bulk-insert (subject, message, recipient) tuples into the outbox; returns the row count."""
+        from .models import OutboundEmail
+
+        max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+        rows = OutboundEmail.objects.bulk_create(
+            [
+                OutboundEmail(
+                    to_email=recipient,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    subject=subject,
+                    body=message,
+                    max_attempts=max_attempts
+                )
+                for subject, message, recipient in emails
+            ],
+            batch_size=500
+        )
+        return len(rows)
+
+    @staticmethod
+    def monthly_unblock_message(name, month_year):
+        subject = f'Account Unblocked - {month_year}'
+        message = f'''
+            Dear {name},
+
             Your account has been unblocked for {month_year}.
             You can now participate in blood donation activities.
-            
+
             Thank you for your continued support!
             Best regards,
             Blood Donation Team
             '''
-            
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-                fail_silently=False,
-            )
-            
-            return True, "Email sent successfully"
-            
+        return subject, message
+
+    @staticmethod
+    def send_monthly_unblock_notification(user, month_year):
+        try:
+            subject, message = EmailService.monthly_unblock_message(user.name, month_year)
+
+            EmailService.queue_email(subject, message, user.email)
+
+            return True, "Email queued successfully"
+
         except Exception as e:
-            logger.error(f"Failed to send unblock notification email to {user.email}: {str(e)}")
+            logger.error(f"Failed to queue unblock notification email to {user.email}: {str(e)}")
             return False, str(e)
-    
+
     @staticmethod
     def send_donor_confirmation_email(donor_user, caller_user, call_log_id):
         try:
-            logger.info(f"Attempting to send confirmation email to {donor_user.email}")
-            
+            logger.info(f"Queueing confirmation email to {donor_user.email}")
+
             subject = 'Blood Donation Confirmation Required'
+            from .tokens import DonorConfirmationToken
+
             base_url = getattr(settings, 'BASE_URL', 'http://192.168.100.16:8000')
-            yes_url = f"{base_url}/donation/confirm-donation/?call_log_id={call_log_id}&response=yes"
-            no_url = f"{base_url}/donation/confirm-donation/?call_log_id={call_log_id}&response=no"
-            
-            logger.info(f"Email URLs - Yes: {yes_url}, No: {no_url}")
-            
+            yes_url = f"{base_url}/donation/confirm-donation/?token={DonorConfirmationToken.make(call_log_id, 'yes')}"
+            no_url = f"{base_url}/donation/confirm-donation/?token={DonorConfirmationToken.make(call_log_id, 'no')}"
+
+            logger.info(f"Confirmation links generated for call log {call_log_id}")
+
             message = f"""
             Dear {donor_user.name},
-            
+
             {caller_user.name} has requested your participation in a blood donation drive.
-            
+
             Please confirm your availability by clicking one of the links below:
-            
+
              YES - I can donate: {yes_url}
-            
+
              NO - I cannot donate: {no_url}
-            
+
             Thank you for your time and consideration.
-            
+
             Best regards,
             Blood Donation Team
             """
-            
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[donor_user.email],
-                fail_silently=False,
-            )
-            
-            logger.info(f"Email sent successfully to {donor_user.email}")
-            return True, "Confirmation email sent successfully"
-            
+
+            EmailService.queue_email(subject, message, donor_user.email)
+
+            logger.info(f"Email queued successfully for {donor_user.email}")
+            return True, "Confirmation email queued successfully"
+
         except Exception as e:
-            logger.error(f"Failed to send confirmation email to {donor_user.email}: {str(e)}")
+            logger.error(f"Failed to queue confirmation email to {donor_user.email}: {str(e)}")
             return False, str(e)
-    
-   
-  
\ No newline at end of file
+
+    @staticmethod
+    def send_donation_reminder_email(donor_user, donation_request):
+        try:
+            subject = 'New Blood Donation Request'
+            message = f'''
+            Dear {donor_user.name},
+
+            {donation_request.requester.name} has requested a {donation_request.blood_group} blood donation from you.
+
+            Notes: {donation_request.notes or '-'}
+
+            Please open the app to respond to this request.
+            Best regards,
+            Blood Donation Team
+            '''
+
+            EmailService.queue_email(subject, message, donor_user.email)
+
+            return True, "Reminder email queued successfully"
+
+        except Exception as e:
+            logger.error(f"Failed to queue donation reminder email to {donor_user.email}: {str(e)}")
+            return False, str(e)
+
+
+class EmailOutbox:
+    """Delivers queued OutboundEmail rows with retries and exponential backoff."""
+
+    # How long a claimed email stays reserved for one worker before others may retry it.
+    SENDING_LEASE = datetime.timedelta(minutes=5)
+
+    @staticmethod
+    def backoff(attempts):
+        base = getattr(settings, 'EMAIL_OUTBOX_BACKOFF_SECONDS', 30)
+        ceiling = getattr(settings, 'EMAIL_OUTBOX_MAX_BACKOFF_SECONDS', 3600)
+        return datetime.timedelta(seconds=min(base * (2 ** (attempts - 1)), ceiling))
+
+    @staticmethod
+    def claim_batch(batch_size):
+        from .models import OutboundEmail
+
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                    status__in=['pending', 'sending'],
+                    next_attempt_at__lte=now
+                ).order_by('next_attempt_at').values_list('id', flat=True)[:batch_size]
+            )
+            if ids:
+                OutboundEmail.objects.filter(id__in=ids).update(
+                    status='sending',
+                    next_attempt_at=now + EmailOutbox.SENDING_LEASE
+                )
+        return list(OutboundEmail.objects.filter(id__in=ids).order_by('next_attempt_at', 'id'))
+
+    @staticmethod
+    def mark_sent(email):
+        from .models import OutboundEmail
+
+        OutboundEmail.objects.filter(id=email.id).update(
+            status='sent',
+            attempts=email.attempts + 1,
+            sent_at=timezone.now(),
+            last_error=None
+        )
+
+    @staticmethod
+    def mark_failed(email, error):
+        from .models import OutboundEmail
+
+        attempts = email.attempts + 1
+        if attempts >= email.max_attempts:
+            OutboundEmail.objects.filter(id=email.id).update(
+                status='failed',
+                attempts=attempts,
+                last_error=str(error)
+            )
+            logger.error(f"Giving up on email {email.id} to {email.to_email} after {attempts} attempts: {error}")
+            return 'failed'
+
+        OutboundEmail.objects.filter(id=email.id).update(
+            status='pending',
+            attempts=attempts,
+            next_attempt_at=timezone.now() + EmailOutbox.backoff(attempts),
+            last_error=str(error)
+        )
+        logger.warning(f"Email {email.id} to {email.to_email} failed (attempt {attempts}), will retry: {error}")
+        return 'retry'
+
+    @staticmethod
+    def drain(batch_size=50, dispatcher=None):
+        """Send one claimed batch; returns counts of sent, retried and failed emails.
+
+        Pass a long-lived SMTPDispatcher to reuse its connection across batches; without one a
+        dispatcher is opened for this batch only.
+        """
+        counts = {'sent': 0, 'retry': 0, 'failed': 0}
+        emails = EmailOutbox.claim_batch(batch_size)
+        if not emails:
+            return counts
+
+        owns_dispatcher = dispatcher is None
+        if owns_dispatcher:
+            dispatcher = SMTPDispatcher()
+
+        try:
+            messages = [
+                EmailMessage(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=email.from_email or settings.DEFAULT_FROM_EMAIL,
+                    to=[email.to_email],
+                )
+                for email in emails
+            ]
+            for email, error in zip(emails, dispatcher.send_messages(messages)):
+                if error is None:
+                    EmailOutbox.mark_sent(email)
+                    counts['sent'] += 1
+                else:
+                    counts[EmailOutbox.mark_failed(email, error)] += 1
+        finally:
+            if owns_dispatcher:
+                dispatcher.close()
+
+        return counts
+
+
+class SMTPDispatcher:
+    """Keeps one authenticated SMTP connection open per worker and reuses it for every batch.
+
+    A dropped connection is reopened transparently and the interrupted message retried once.
+    Messages are written one at a time over the shared connection (which is what Django's
+    send_messages does internally) so each outbox row gets its own result.
+    """
+
+    RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError)
+
+    def __init__(self):
+        self.connection = None
+        self.sent_count = 0
+        self.reconnects = 0
+        self.started_at = time.monotonic()
+
+    def _connect(self):
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+        self.connection.open()
+
+    def _reconnect(self):
+        self.reconnects += 1
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+        self._connect()
+
+    def _send(self, message):
+        message.connection = self.connection
+        return self.connection.send_messages([message])
+
+    def send_messages(self, messages):
+        """Send messages over the shared connection; returns one error (or None) per message."""
+        results = []
+        for message in messages:
+            try:
+                if self.connection is None:
+                    self._connect()
+                try:
+                    self._send(message)
+                except self.RECONNECT_ERRORS as e:
+                    logger.warning(f"SMTP connection dropped ({e}), reconnecting")
+                    self._reconnect()
+                    self._send(message)
+                self.sent_count += 1
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def messages_per_second(self):
+        elapsed = time.monotonic() - self.started_at
+        return self.sent_count / elapsed if elapsed > 0 else 0.0
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from donation.services import ArchiveService
+import time
+
+
+class Command(BaseCommand):
+    help = 'Move finished donation requests and call logs older than N days into the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.ARCHIVE_AFTER_DAYS,
+            help=f'Archive rows finished more than this many days ago (default: {settings.ARCHIVE_AFTER_DAYS})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of rows moved per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.1,
+            help='Seconds to pause between batches so other writers get the tables (default: 0.1)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many rows would be archived',
+        )
+
+    def archive(self, label, archive_batch, cutoff, options):
+        archived = 0
+        batches = 0
+        started = time.monotonic()
+        while True:
+            moved = archive_batch(cutoff, options['batch_size'])
+            archived += moved
+            if moved:
+                batches += 1
+
+            if moved < options['batch_size']:
+                break
+            time.sleep(options['sleep'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'ARCHIVE DONE: Moved {archived} {label} in {batches} batches '
+                f'({time.monotonic() - started:.2f} seconds)'
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        if options['days'] < 0:
+            raise CommandError('--days must not be negative')
+
+        cutoff = ArchiveService.cutoff(options['days'])
+        self.stdout.write(f'Archiving rows finished before {cutoff:%Y-%m-%d %H:%M}')
+
+        if options['dry_run']:
+            requests = ArchiveService.archivable_requests(cutoff).count()
+            call_logs = ArchiveService.archivable_call_logs(cutoff).count()
+            self.stdout.write(
+                self.style.WARNING(f'DRY RUN: {requests} donation requests and {call_logs} call logs would be archived')
+            )
+            return
+
+        # Call logs first, so they are archived while the request they point to is still hot.
+        self.archive('call logs', ArchiveService.archive_call_logs_batch, cutoff, options)
+        self.archive('donation requests', ArchiveService.archive_requests_batch, cutoff, options)
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from donation.services import DonationRequestService
+import time
+
+
+class Command(BaseCommand):
+    help = 'Cancel open donation requests whose expires_at has passed, in small batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of expired requests cancelled per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.1,
+            help='Seconds to pause between batches so other writers get the table (default: 0.1)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many requests would be cancelled',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        now = timezone.now()
+
+        if options['dry_run']:
+            count = DonationRequestService.expired_queryset(now).count()
+            self.stdout.write(self.style.WARNING(f'DRY RUN: {count} expired requests would be cancelled'))
+            return
+
+        expired = 0
+        batches = 0
+        started = time.monotonic()
+        while True:
+            cancelled = DonationRequestService.expire_batch(options['batch_size'], now)
+            expired += cancelled
+            if cancelled:
+                batches += 1
+
+            if cancelled < options['batch_size']:
+                break
+            time.sleep(options['sleep'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'EXPIRY DONE: Cancelled {expired} expired requests in {batches} batches '
+                f'({time.monotonic() - started:.2f} seconds)'
+            )
+        )
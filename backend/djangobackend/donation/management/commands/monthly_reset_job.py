@@ -1,20 +1,59 @@
-from django.core.management.base import BaseCommand
-from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from django.conf import settings
+from django.db import connections
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+import django
 import logging
 import os
 import traceback
 
 
+def _init_worker():
+    # Needed when the pool spawns fresh interpreters; a no-op for forked workers.
+    django.setup()
+
+
 class Command(BaseCommand):
-    help = 'Wrapper command for monthly reset job with enhanced logging'
-    
+    help = 'Chunked, resumable monthly reset job with per-chunk checkpoints and enhanced logging'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--month',
+            type=str,
+            help='Month to reset in YYYY-MM format (default: current month)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of user ids per chunk (default: 1000)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of processes that reset chunks in parallel (default: 1)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Also reset trackers that already completed the goal this month',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Discard existing checkpoints for the month and start from the first chunk',
+        )
+
     def handle(self, *args, **options):
-    
+        from donation.models import MonthlyResetCheckpoint
+        from donation.services import MonthlyResetService
+
         log_file = os.path.join(settings.BASE_DIR, 'logs', 'monthly_reset.log')
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        
+
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
@@ -23,33 +62,92 @@ class Command(BaseCommand):
                 logging.StreamHandler()
             ]
         )
-        
+
         logger = logging.getLogger(__name__)
-        
+
+        if options['chunk_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--chunk-size and --workers must be at least 1')
+
+        if options['month']:
+            try:
+                target_month = datetime.strptime(options['month'], '%Y-%m').date()
+            except ValueError:
+                raise CommandError('Invalid month format. Use YYYY-MM (e.g., 2025-09)')
+        else:
+            target_month = timezone.now().date().replace(day=1)
+
+        checkpoints = MonthlyResetCheckpoint.objects.filter(month=target_month)
+        if options['restart']:
+            deleted, _ = checkpoints.delete()
+            logger.info(f'Discarded {deleted} checkpoints for {target_month.strftime("%B %Y")}')
+        elif checkpoints.exclude(chunk_size=options['chunk_size']).exists():
+            raise CommandError(
+                'Existing checkpoints for this month use a different chunk size. '
+                'Re-run with the same --chunk-size or pass --restart.'
+            )
+
         try:
             start_time = timezone.now()
-            logger.info(f'Starting monthly reset job at {start_time}')
-            
-            
-            call_command('reset_monthly_counts')
-            
+            logger.info(f'Starting monthly reset job for {target_month.strftime("%B %Y")} at {start_time}')
+
+            done = set(checkpoints.values_list('chunk_start', flat=True))
+            chunks = [
+                (start, end) for start, end in MonthlyResetService.chunk_ranges(options['chunk_size'])
+                if start not in done
+            ]
+            logger.info(f'{len(done)} chunks already checkpointed, {len(chunks)} chunks to process')
+
+            totals = {'created_trackers': 0, 'reset_trackers': 0, 'unblocked_users': 0, 'queued_emails': 0}
+            skipped = 0
+
+            def record(chunk, stats):
+                nonlocal skipped
+                if stats is None:
+                    skipped += 1
+                    logger.info(f'Chunk [{chunk[0]}, {chunk[1]}) already done by another run, skipped')
+                    return
+                for key, value in stats.items():
+                    totals[key] += value
+                if stats['unblocked_users'] or stats['created_trackers'] or stats['reset_trackers']:
+                    logger.info(f'Chunk [{chunk[0]}, {chunk[1]}) done: {stats}')
+
+            if options['workers'] == 1:
+                for chunk in chunks:
+                    record(chunk, MonthlyResetService.reset_chunk(target_month, *chunk, force=options['force']))
+            else:
+                # Child processes must open their own database connections.
+                connections.close_all()
+                with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as pool:
+                    futures = {
+                        pool.submit(MonthlyResetService.reset_chunk, target_month, *chunk, force=options['force']): chunk
+                        for chunk in chunks
+                    }
+                    for future in as_completed(futures):
+                        record(futures[future], future.result())
+
             end_time = timezone.now()
             duration = end_time - start_time
-            logger.info(f'Monthly reset completed successfully in {duration.total_seconds():.2f} seconds')
-            
+            logger.info(
+                f'Monthly reset completed successfully in {duration.total_seconds():.2f} seconds: '
+                f'{len(chunks) - skipped} chunks, {totals["created_trackers"]} trackers created, '
+                f'{totals["reset_trackers"]} trackers reset, {totals["unblocked_users"]} users unblocked, '
+                f'{totals["queued_emails"]} emails queued'
+            )
+
             self.stdout.write(
                 self.style.SUCCESS(f'Monthly reset job completed successfully at {end_time}')
             )
-            
+
         except Exception as e:
             error_time = timezone.now()
             error_msg = f'Monthly reset job failed at {error_time}: {str(e)}'
             logger.error(error_msg)
             logger.error(f'Traceback: {traceback.format_exc()}')
-            
+            logger.error('Completed chunks are checkpointed; re-run the job to resume from the first unfinished chunk')
+
             self.stdout.write(
                 self.style.ERROR(error_msg)
             )
-            
-            
-            raise e
\ No newline at end of file
+
+
+            raise e
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from donation.services import AdminBulkActionService
+import time
+
+
+class Command(BaseCommand):
+    help = 'Run queued admin bulk actions (block, unblock, reset, delete) chunk by chunk with progress tracking'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run the jobs that are currently queued and exit instead of polling forever',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep when no job is queued (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        finished = 0
+
+        try:
+            while True:
+                job = AdminBulkActionService.claim_job()
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+                    continue
+
+                self.stdout.write(f'Running {job.get_action_display().lower()} job #{job.id} ({job.total} rows)')
+                job = AdminBulkActionService.process_job(job)
+                finished += 1
+
+                if job.status == 'done':
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'Job #{job.id} done: {job.affected} rows changed, {job.queued_emails} emails queued'
+                        )
+                    )
+                else:
+                    self.stdout.write(self.style.ERROR(f'Job #{job.id} failed: {job.last_error}'))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Interrupted, stopping bulk action worker'))
+
+        self.stdout.write(f'Processed {finished} bulk action jobs')
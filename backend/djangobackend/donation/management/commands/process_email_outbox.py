@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from donation.email_config import EmailOutbox, SMTPDispatcher
+import time
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued outbound emails, retrying failures with exponential backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='Number of emails claimed per batch (default: 50)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the emails that are currently due and exit instead of polling forever',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep when the outbox is empty (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        totals = {'sent': 0, 'retry': 0, 'failed': 0}
+
+        dispatcher = SMTPDispatcher()
+
+        self.stdout.write('Processing email outbox...')
+
+        try:
+            while True:
+                counts = EmailOutbox.drain(batch_size=batch_size, dispatcher=dispatcher)
+                for key, value in counts.items():
+                    totals[key] += value
+
+                if any(counts.values()):
+                    self.stdout.write(
+                        f'Sent {counts["sent"]}, scheduled {counts["retry"]} retries, {counts["failed"]} failed permanently '
+                        f'({dispatcher.messages_per_second():.1f} messages/sec)'
+                    )
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Interrupted, stopping outbox worker'))
+        finally:
+            dispatcher.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'OUTBOX DONE: Sent {totals["sent"]}, retries scheduled {totals["retry"]}, failed {totals["failed"]} '
+                f'({dispatcher.messages_per_second():.1f} messages/sec, {dispatcher.reconnects} reconnects)'
+            )
+        )
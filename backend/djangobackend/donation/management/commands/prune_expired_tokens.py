@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+import time
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding and blacklisted JWTs in small batches, safe to run with live traffic'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of expired tokens deleted per transaction (default: 1000)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.1,
+            help='Seconds to pause between batches so other writers get the table (default: 0.1)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many tokens would be deleted',
+        )
+
+    def table_sizes(self):
+        return OutstandingToken.objects.count(), BlacklistedToken.objects.count()
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        cutoff = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lt=cutoff)
+
+        outstanding_before, blacklisted_before = self.table_sizes()
+        self.stdout.write(
+            f'Before: {outstanding_before} outstanding tokens, {blacklisted_before} blacklisted tokens'
+        )
+
+        if options['dry_run']:
+            self.stdout.write(
+                self.style.WARNING(f'DRY RUN: {expired.count()} expired tokens would be deleted')
+            )
+            return
+
+        deleted = 0
+        batches = 0
+        started = time.monotonic()
+        while True:
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+
+            # Blacklist rows go with their token (CASCADE); each batch is its own short transaction.
+            with transaction.atomic():
+                deleted += OutstandingToken.objects.filter(id__in=ids).delete()[1].get(OutstandingToken._meta.label, 0)
+            batches += 1
+
+            if len(ids) < options['batch_size']:
+                break
+            time.sleep(options['sleep'])
+
+        outstanding_after, blacklisted_after = self.table_sizes()
+        self.stdout.write(
+            f'After: {outstanding_after} outstanding tokens, {blacklisted_after} blacklisted tokens'
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'PRUNE DONE: Deleted {deleted} expired tokens in {batches} batches '
+                f'({time.monotonic() - started:.2f} seconds)'
+            )
+        )
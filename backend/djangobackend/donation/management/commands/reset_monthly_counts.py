@@ -23,6 +23,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Force reset even if already done for the month',
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Reset with a few set-based statements in one transaction instead of per-user saves',
+        )
     
     def handle(self, *args, **options):
         
@@ -39,6 +44,10 @@ class Command(BaseCommand):
             target_month = timezone.now().date().replace(day=1)
         
         self.stdout.write(f'Processing monthly reset for: {target_month.strftime("%B %Y")}')
+        
+        if options['bulk']:
+            self._handle_bulk(target_month, options)
+            return
   
         previous_month = target_month - timedelta(days=1)
         previous_month_start = previous_month.replace(day=1)
@@ -77,7 +86,7 @@ class Command(BaseCommand):
                     continue
                 
                 if not options['dry_run']:
-                    current_tracker.reset_for_new_month()
+                    current_tracker.reset_for_new_month(notify=False)
                   
                     month_year = target_month.strftime('%B %Y')
                     self._send_unblock_email(user, month_year)
@@ -102,7 +111,7 @@ class Command(BaseCommand):
         if current_month_trackers.exists() and options['force']:
             for tracker in current_month_trackers:
                 if not options['dry_run']:
-                    tracker.reset_for_new_month()
+                    tracker.reset_for_new_month(notify=False)
                     
                  
                     month_year = target_month.strftime('%B %Y')
@@ -143,6 +152,28 @@ class Command(BaseCommand):
             f'Current blocked users for {target_month.strftime("%B %Y")}: {current_blocked}'
         )
     
+    def _handle_bulk(self, target_month, options):
+        from donation.services import MonthlyResetService
+        
+        stats, timings = MonthlyResetService.reset_month(
+            target_month,
+            force=options['force'],
+            dry_run=options['dry_run']
+        )
+        
+        for phase, seconds in timings.items():
+            self.stdout.write(f'  {phase}: {seconds * 1000:.1f} ms')
+        
+        summary = (
+            f'created {stats["created_trackers"]} trackers, reset {stats["reset_trackers"]} trackers, '
+            f'unblocked {stats["unblocked_users"]} users and queued {stats["queued_emails"]} emails '
+            f'for {target_month.strftime("%B %Y")} in {sum(timings.values()):.2f}s'
+        )
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'DRY RUN COMPLETE: Would have {summary}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'BULK RESET COMPLETE: {summary}'))
+    
     def _send_unblock_email(self, user, month_year):
         """
         Send email notification to user when they get unblocked.
@@ -158,11 +189,11 @@ class Command(BaseCommand):
             
             if success:
                 self.stdout.write(
-                    f'  ✓ Unblock email sent to {user.email}'
+                    f'  ✓ Unblock email queued for {user.email}'
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING(f'  ⚠ Failed to send email to {user.email}: {message}')
+                    self.style.WARNING(f'  ⚠ Failed to queue email for {user.email}: {message}')
                 )
                 
         except ImportError:
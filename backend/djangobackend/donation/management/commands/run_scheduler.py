@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+from donation.scheduler import configured_jobs, run_job
+import datetime
+import logging
+import time
+
+
+class Command(BaseCommand):
+    help = 'Run scheduled jobs (monthly reset, email outbox, cleanups) with database locks so only one node runs each job'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run the jobs due in the current minute and exit',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List the configured jobs and exit',
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=4,
+            help='Maximum number of jobs running at the same time on this node (default: 4)',
+        )
+
+    def handle(self, *args, **options):
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+        jobs = configured_jobs()
+
+        if options['list']:
+            for job in jobs:
+                self.stdout.write(str(job))
+            return
+
+        self.stdout.write(f'Scheduler started with {len(jobs)} jobs')
+
+        with ThreadPoolExecutor(max_workers=options['max_workers']) as pool:
+            try:
+                while True:
+                    slot = timezone.now().replace(second=0, microsecond=0)
+                    due = [job for job in jobs if job.schedule.matches(slot)]
+                    for job in due:
+                        pool.submit(run_job, job, slot)
+
+                    if options['once']:
+                        break
+
+                    next_slot = slot + datetime.timedelta(minutes=1)
+                    time.sleep(max(0.0, (next_slot - timezone.now()).total_seconds()))
+            except KeyboardInterrupt:
+                self.stdout.write(self.style.WARNING('Stopping scheduler, waiting for running jobs to finish'))
+
+        self.stdout.write(self.style.SUCCESS('Scheduler stopped'))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0012_calllog_call_method_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calllog',
+            name='call_method',
+            field=models.CharField(choices=[('dialer', 'Phone Dialer'), ('whatsapp', 'WhatsApp Call')], default='dialer', help_text='Method used to make the call', max_length=10, verbose_name='Call Method'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['role', 'city', 'blood_group'], name='idx_profile_donor_search'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0013_calllog_call_method_profile_idx_profile_donor_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['requester', 'donor'], name='idx_dr_pending_pair'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0015_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyResetCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='Month')),
+                ('chunk_start', models.PositiveBigIntegerField(verbose_name='Chunk Start User ID')),
+                ('chunk_end', models.PositiveBigIntegerField(verbose_name='Chunk End User ID')),
+                ('chunk_size', models.PositiveIntegerField(verbose_name='Chunk Size')),
+                ('created_trackers', models.PositiveIntegerField(default=0, verbose_name='Created Trackers')),
+                ('reset_trackers', models.PositiveIntegerField(default=0, verbose_name='Reset Trackers')),
+                ('unblocked_users', models.PositiveIntegerField(default=0, verbose_name='Unblocked Users')),
+                ('queued_emails', models.PositiveIntegerField(default=0, verbose_name='Queued Emails')),
+                ('completed_at', models.DateTimeField(auto_now_add=True, verbose_name='Completed At')),
+            ],
+            options={
+                'verbose_name': 'Monthly Reset Checkpoint',
+                'verbose_name_plural': 'Monthly Reset Checkpoints',
+                'ordering': ['month', 'chunk_start'],
+                'unique_together': {('month', 'chunk_start')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0016_monthlyresetcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchedulerLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Job Name')),
+                ('owner', models.CharField(blank=True, max_length=255, verbose_name='Owner')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='Locked Until')),
+                ('last_slot', models.DateTimeField(blank=True, null=True, verbose_name='Last Scheduled Slot')),
+                ('last_started_at', models.DateTimeField(blank=True, null=True, verbose_name='Last Started At')),
+                ('last_finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Last Finished At')),
+                ('last_status', models.CharField(blank=True, max_length=10, verbose_name='Last Status')),
+                ('last_error', models.TextField(blank=True, null=True, verbose_name='Last Error')),
+            ],
+            options={
+                'verbose_name': 'Scheduler Lock',
+                'verbose_name_plural': 'Scheduler Locks',
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:24
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('donation', '0017_schedulerlock'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='idx_user_name_ci'),
+        ),
+    ]
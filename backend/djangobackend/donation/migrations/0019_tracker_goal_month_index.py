@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0018_user_name_ci_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='monthlydonationtracker',
+            index=models.Index(condition=models.Q(('monthly_goal_completed', True)), fields=['monthly_goal_completed', 'month'], name='idx_tracker_goal_month'),
+        ),
+    ]
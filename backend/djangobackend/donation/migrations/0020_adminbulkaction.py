@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0019_tracker_goal_month_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminBulkAction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('block', 'Block users'), ('unblock', 'Unblock users'), ('reset_trackers', 'Reset current month trackers'), ('delete', 'Delete users')], max_length=20, verbose_name='Action')),
+                ('target_ids', models.JSONField(default=list, help_text='User ids, or tracker ids for reset_trackers', verbose_name='Target IDs')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Total')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='Processed')),
+                ('affected', models.PositiveIntegerField(default=0, verbose_name='Affected Rows')),
+                ('queued_emails', models.PositiveIntegerField(default=0, verbose_name='Queued Emails')),
+                ('requested_by', models.CharField(blank=True, max_length=254, verbose_name='Requested By')),
+                ('last_error', models.TextField(blank=True, null=True, verbose_name='Last Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+            ],
+            options={
+                'verbose_name': 'Admin Bulk Action',
+                'verbose_name_plural': 'Admin Bulk Actions',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='donation_ad_status_e39672_idx')],
+            },
+        ),
+    ]
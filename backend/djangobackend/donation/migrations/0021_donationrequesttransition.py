@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0020_adminbulkaction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DonationRequestTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(max_length=30, verbose_name='Event')),
+                ('from_status', models.CharField(choices=[('pending', 'Pending'), ('user_accepted', 'User Accepted'), ('donor_accepted', 'Donor Accepted'), ('both_accepted', 'Both Accepted'), ('user_declined', 'User Declined'), ('donor_declined', 'Donor Declined'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20, verbose_name='From Status')),
+                ('to_status', models.CharField(choices=[('pending', 'Pending'), ('user_accepted', 'User Accepted'), ('donor_accepted', 'Donor Accepted'), ('both_accepted', 'Both Accepted'), ('user_declined', 'User Declined'), ('donor_declined', 'Donor Declined'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20, verbose_name='To Status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('actor', models.ForeignKey(blank=True, help_text='User who triggered the transition, empty for email links and jobs', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='donation_request_transitions', to=settings.AUTH_USER_MODEL)),
+                ('donation_request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='donation.donationrequest')),
+            ],
+            options={
+                'verbose_name': 'Donation Request Transition',
+                'verbose_name_plural': 'Donation Request Transitions',
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['donation_request', 'created_at'], name='donation_do_donatio_007428_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+import datetime
+
+import donation.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_expires_at(apps, schema_editor):
+    DonationRequest = apps.get_model('donation', 'DonationRequest')
+    DonationRequest.objects.filter(
+        expires_at__isnull=True,
+        status__in=['pending', 'user_accepted', 'donor_accepted']
+    ).update(expires_at=models.F('created_at') + datetime.timedelta(hours=settings.DONATION_REQUEST_TTL_HOURS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0021_donationrequesttransition'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donationrequest',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, default=donation.models.default_donation_request_expiry, help_text='Open requests past this time are cancelled by expire_donation_requests', null=True, verbose_name='Expires At'),
+        ),
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(fields=['status', 'expires_at'], name='idx_dr_status_expires'),
+        ),
+        migrations.RunPython(backfill_expires_at, migrations.RunPython.noop),
+    ]
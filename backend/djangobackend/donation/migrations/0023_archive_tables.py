@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0022_donationrequest_expiry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedCallLog',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('call_status', models.CharField(choices=[('initiated', 'Initiated'), ('answered', 'Answered'), ('completed', 'Completed'), ('missed', 'Missed'), ('declined', 'Declined')], max_length=20, verbose_name='Call Status')),
+                ('duration_seconds', models.PositiveIntegerField(blank=True, null=True, verbose_name='Duration (seconds)')),
+                ('caller_confirmed', models.BooleanField(default=False, verbose_name='Caller Confirmed')),
+                ('receiver_confirmed', models.BooleanField(default=False, verbose_name='Receiver Confirmed')),
+                ('both_confirmed', models.BooleanField(default=False, verbose_name='Both Confirmed')),
+                ('email_sent', models.BooleanField(default=False, verbose_name='Email Sent')),
+                ('email_sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Email Sent At')),
+                ('donor_email_response', models.CharField(max_length=10, verbose_name='Donor Email Response')),
+                ('email_response_at', models.DateTimeField(blank=True, null=True, verbose_name='Email Response At')),
+                ('call_method', models.CharField(max_length=10, verbose_name='Call Method')),
+                ('created_at', models.DateTimeField(verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated At')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Archived At')),
+                ('caller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('receiver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Call Log',
+                'verbose_name_plural': 'Archived Call Logs',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedDonationRequest',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('blood_group', models.CharField(max_length=5, verbose_name='Blood Group')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('user_accepted', 'User Accepted'), ('donor_accepted', 'Donor Accepted'), ('both_accepted', 'Both Accepted'), ('user_declined', 'User Declined'), ('donor_declined', 'Donor Declined'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20, verbose_name='Status')),
+                ('user_response', models.BooleanField(blank=True, null=True, verbose_name='User Response')),
+                ('donor_response', models.BooleanField(blank=True, null=True, verbose_name='Donor Response')),
+                ('notes', models.TextField(blank=True, null=True, verbose_name='Notes')),
+                ('created_at', models.DateTimeField(verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated At')),
+                ('expires_at', models.DateTimeField(blank=True, null=True, verbose_name='Expires At')),
+                ('transitions', models.JSONField(blank=True, default=list, verbose_name='Transitions')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Archived At')),
+                ('donor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('requester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Donation Request',
+                'verbose_name_plural': 'Archived Donation Requests',
+            },
+        ),
+    ]
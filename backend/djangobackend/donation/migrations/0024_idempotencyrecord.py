@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0023_archive_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Key')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Status Code')),
+                ('response', models.JSONField(blank=True, null=True, verbose_name='Response')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Idempotency Record',
+                'verbose_name_plural': 'Idempotency Records',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0024_idempotencyrecord'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedcalllog',
+            name='donation_request_id',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='Donation Request ID'),
+        ),
+        migrations.AddField(
+            model_name='calllog',
+            name='donation_request',
+            field=models.ForeignKey(blank=True, help_text='Donation request this call was made for', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='call_logs', to='donation.donationrequest'),
+        ),
+    ]
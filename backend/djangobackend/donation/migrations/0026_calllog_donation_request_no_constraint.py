@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0025_calllog_donation_request'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='calllog',
+            name='donation_request',
+            field=models.ForeignKey(blank=True, db_constraint=False, help_text='Donation request this call was made for', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='call_logs', to='donation.donationrequest'),
+        ),
+    ]
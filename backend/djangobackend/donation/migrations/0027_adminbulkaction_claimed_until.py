@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0026_calllog_donation_request_no_constraint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adminbulkaction',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Lease of the worker running the job, renewed after every chunk', null=True, verbose_name='Claimed Until'),
+        ),
+    ]
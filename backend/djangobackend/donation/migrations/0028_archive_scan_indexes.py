@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0027_adminbulkaction_claimed_until'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calllog',
+            index=models.Index(fields=['updated_at'], name='idx_calllog_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(fields=['status', 'updated_at'], name='idx_dr_status_updated'),
+        ),
+    ]
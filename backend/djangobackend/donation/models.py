@@ -1,11 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import BaseUserManager, AbstractBaseUser, PermissionsMixin
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.db.models.functions import Lower
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 import secrets
 import hashlib
@@ -86,6 +86,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         ]
         indexes = [
             models.Index(Lower('email'), name='idx_user_email_ci'),
+            models.Index(Lower('name'), name='idx_user_name_ci'),
         ]
 
     def __str__(self):
@@ -265,6 +266,9 @@ class Profile(models.Model):
     class Meta:
         verbose_name = _('Profile')
         verbose_name_plural = _('Profiles')
+        indexes = [
+            models.Index(fields=['role', 'city', 'blood_group'], name='idx_profile_donor_search'),
+        ]
     
     def clean(self):
       
@@ -305,6 +309,13 @@ class Profile(models.Model):
         self.clean()
         super().save(*args, **kwargs)
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded search bucket so moving city/blood group also invalidates the old one.
+        instance._search_key = (instance.__dict__.get('blood_group'), instance.__dict__.get('city'))
+        return instance
+    
     def __str__(self):
         return f"{self.user.email} - Profile"
     
@@ -316,6 +327,12 @@ class Profile(models.Model):
         return self.first_name or self.last_name or self.user.name
 
 
+def default_donation_request_expiry():
+    from django.conf import settings
+
+    return timezone.now() + datetime.timedelta(hours=settings.DONATION_REQUEST_TTL_HOURS)
+
+
 class DonationRequest(models.Model):
   
     STATUS_CHOICES = [
@@ -380,7 +397,9 @@ class DonationRequest(models.Model):
     expires_at = models.DateTimeField(
         _('Expires At'),
         null=True,
-        blank=True
+        blank=True,
+        default=default_donation_request_expiry,
+        help_text='Open requests past this time are cancelled by expire_donation_requests'
     )
     
     class Meta:
@@ -391,29 +410,125 @@ class DonationRequest(models.Model):
             models.Index(fields=['requester', 'status']),
             models.Index(fields=['donor', 'status']),
             models.Index(fields=['blood_group', 'status']),
+            models.Index(
+                fields=['requester', 'donor'],
+                condition=models.Q(status='pending'),
+                name='idx_dr_pending_pair'
+            ),
+            models.Index(fields=['status', 'expires_at'], name='idx_dr_status_expires'),
+            models.Index(fields=['status', 'updated_at'], name='idx_dr_status_updated'),
         ]
     
     def __str__(self):
         return f"Request from {self.requester.name} to {self.donor.name} for {self.blood_group}"
     
-    def update_status(self):
-        """Update status based on user and donor responses."""
-        if self.user_response is True and self.donor_response is True:
-            self.status = 'both_accepted'
-        elif self.user_response is True and self.donor_response is None:
-            self.status = 'user_accepted'
-        elif self.user_response is None and self.donor_response is True:
-            self.status = 'donor_accepted'
-        elif self.user_response is False:
-            self.status = 'user_declined'
-        elif self.donor_response is False:
-            self.status = 'donor_declined'
-        else:
-            self.status = 'pending'
-        self.save()
+    OPEN_STATUSES = ('pending', 'user_accepted', 'donor_accepted', 'both_accepted')
+    TERMINAL_STATUSES = ('user_declined', 'donor_declined', 'completed', 'cancelled')
+    # Still waiting on one side; these are cancelled once expires_at passes.
+    EXPIRABLE_STATUSES = ('pending', 'user_accepted', 'donor_accepted')
+
+    # event -> columns it sets and the status it moves each allowed source status to.
+    TRANSITIONS = {
+        'requester_accept': {
+            'set': {'user_response': True},
+            'from': {'pending': 'user_accepted', 'donor_accepted': 'both_accepted'},
+        },
+        'requester_decline': {
+            'set': {'user_response': False},
+            'from': {status: 'user_declined' for status in OPEN_STATUSES},
+        },
+        'donor_accept': {
+            'set': {'donor_response': True},
+            'from': {'pending': 'donor_accepted', 'user_accepted': 'both_accepted'},
+        },
+        'donor_decline': {
+            'set': {'donor_response': False},
+            'from': {status: 'donor_declined' for status in OPEN_STATUSES},
+        },
+        # Donor agreed from the email link: the request is done once the requester has agreed too.
+        'donor_confirm': {
+            'set': {'donor_response': True},
+            'from': {'pending': 'donor_accepted', 'user_accepted': 'completed', 'both_accepted': 'completed'},
+        },
+        'complete': {
+            'set': {},
+            'from': {'both_accepted': 'completed'},
+        },
+        'expire': {
+            'set': {},
+            'from': {status: 'cancelled' for status in EXPIRABLE_STATUSES},
+        },
+    }
 
+    def apply_transition(self, event, actor=None, attempts=3):
+        """Move the request along TRANSITIONS with one guarded UPDATE and record it in the history.
+
+        The UPDATE only matches while the row still has the status it was read with, so concurrent
+        responses cannot overwrite each other; on a lost race the status is re-read and the event is
+        re-applied from there. Only the event's columns, status and updated_at are written.
+        Returns True if the transition happened, False if the event is not allowed from the
+        current status (self.status is refreshed either way).
+        """
+        transition = self.TRANSITIONS[event]
+
+        for _attempt in range(attempts):
+            from_status = self.status
+            to_status = transition['from'].get(from_status)
+            if to_status is None:
+                return False
+
+            changes = dict(transition['set'], status=to_status, updated_at=timezone.now())
+            with transaction.atomic():
+                updated = DonationRequest.objects.filter(id=self.id, status=from_status).update(**changes)
+                if updated:
+                    DonationRequestTransition.objects.create(
+                        donation_request_id=self.id,
+                        event=event,
+                        from_status=from_status,
+                        to_status=to_status,
+                        actor=actor
+                    )
+            if updated:
+                for field, value in changes.items():
+                    setattr(self, field, value)
+                return True
+
+            self.status = DonationRequest.objects.values_list('status', flat=True).get(id=self.id)
+
+        return False
+
+
+class DonationRequestTransition(models.Model):
+    """Append-only log of DonationRequest status changes, written with each transition."""
+
+    donation_request = models.ForeignKey(
+        DonationRequest,
+        on_delete=models.CASCADE,
+        related_name='transitions'
+    )
+    event = models.CharField(_('Event'), max_length=30)
+    from_status = models.CharField(_('From Status'), max_length=20, choices=DonationRequest.STATUS_CHOICES)
+    to_status = models.CharField(_('To Status'), max_length=20, choices=DonationRequest.STATUS_CHOICES)
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='donation_request_transitions',
+        help_text='User who triggered the transition, empty for email links and jobs'
+    )
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
 
+    class Meta:
+        verbose_name = _('Donation Request Transition')
+        verbose_name_plural = _('Donation Request Transitions')
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['donation_request', 'created_at']),
+        ]
 
+    def __str__(self):
+        return f"Request #{self.donation_request_id}: {self.from_status} -> {self.to_status} ({self.event})"
 
 
 class CallLog(models.Model):
@@ -425,6 +540,7 @@ class CallLog(models.Model):
         ('missed', 'Missed'),
         ('declined', 'Declined'),
     ]
+    FINISHED_CALL_STATUSES = ('completed', 'missed', 'declined')
     
     caller = models.ForeignKey(
         User,
@@ -438,6 +554,16 @@ class CallLog(models.Model):
         related_name='calls_received',
         help_text='User who received the call'
     )
+    # No constraint and DO_NOTHING: the id must survive the request moving to ArchivedDonationRequest.
+    donation_request = models.ForeignKey(
+        DonationRequest,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='call_logs',
+        help_text='Donation request this call was made for'
+    )
    
     call_status = models.CharField(
         _('Call Status'),
@@ -517,6 +643,7 @@ class CallLog(models.Model):
             models.Index(fields=['caller', 'call_status']),
             models.Index(fields=['receiver', 'call_status']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['updated_at'], name='idx_calllog_updated'),
         ]
     
     def __str__(self):
@@ -530,7 +657,67 @@ class CallLog(models.Model):
             self.save()
 
 
+class ArchivedDonationRequest(models.Model):
+    """Terminal DonationRequest rows moved out of the hot table by archive_old_records.
+
+    Rows keep their original id, so references and cursors stay valid; the status history is
+    folded into the transitions column.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    requester = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    donor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    blood_group = models.CharField(_('Blood Group'), max_length=5)
+    status = models.CharField(_('Status'), max_length=20, choices=DonationRequest.STATUS_CHOICES)
+    user_response = models.BooleanField(_('User Response'), null=True, blank=True)
+    donor_response = models.BooleanField(_('Donor Response'), null=True, blank=True)
+    notes = models.TextField(_('Notes'), blank=True, null=True)
+    created_at = models.DateTimeField(_('Created At'))
+    updated_at = models.DateTimeField(_('Updated At'))
+    expires_at = models.DateTimeField(_('Expires At'), null=True, blank=True)
+    transitions = models.JSONField(_('Transitions'), default=list, blank=True)
+    archived_at = models.DateTimeField(_('Archived At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Archived Donation Request')
+        verbose_name_plural = _('Archived Donation Requests')
+
+    def __str__(self):
+        return f"Archived request #{self.id} ({self.status})"
+
+
+class ArchivedCallLog(models.Model):
+    """Finished CallLog rows moved out of the hot table by archive_old_records, keeping their id."""
+
+    id = models.BigIntegerField(primary_key=True)
+    caller = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    receiver = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    donation_request_id = models.BigIntegerField(_('Donation Request ID'), null=True, blank=True)
+    call_status = models.CharField(_('Call Status'), max_length=20, choices=CallLog.CALL_STATUS_CHOICES)
+    duration_seconds = models.PositiveIntegerField(_('Duration (seconds)'), null=True, blank=True)
+    caller_confirmed = models.BooleanField(_('Caller Confirmed'), default=False)
+    receiver_confirmed = models.BooleanField(_('Receiver Confirmed'), default=False)
+    both_confirmed = models.BooleanField(_('Both Confirmed'), default=False)
+    email_sent = models.BooleanField(_('Email Sent'), default=False)
+    email_sent_at = models.DateTimeField(_('Email Sent At'), null=True, blank=True)
+    donor_email_response = models.CharField(_('Donor Email Response'), max_length=10)
+    email_response_at = models.DateTimeField(_('Email Response At'), null=True, blank=True)
+    call_method = models.CharField(_('Call Method'), max_length=10)
+    created_at = models.DateTimeField(_('Created At'))
+    updated_at = models.DateTimeField(_('Updated At'))
+    archived_at = models.DateTimeField(_('Archived At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Archived Call Log')
+        verbose_name_plural = _('Archived Call Logs')
+
+    def __str__(self):
+        return f"Archived call #{self.id} ({self.call_status})"
+
+
 class MonthlyDonationTracker(models.Model):
+
+    MONTHLY_CALL_GOAL = 3
   
     user = models.ForeignKey(
         User,
@@ -564,6 +751,11 @@ class MonthlyDonationTracker(models.Model):
         indexes = [
             models.Index(fields=['user', 'month']),
             models.Index(fields=['monthly_goal_completed']),
+            models.Index(
+                fields=['monthly_goal_completed', 'month'],
+                condition=models.Q(monthly_goal_completed=True),
+                name='idx_tracker_goal_month'
+            ),
         ]
 
     def __str__(self):
@@ -571,14 +763,69 @@ class MonthlyDonationTracker(models.Model):
 
     def increment_call_count(self):
         
-        self.completed_calls_count += 1
-        if self.completed_calls_count >= 3 and not self.monthly_goal_completed:
-            self.monthly_goal_completed = True
-            self.goal_completed_at = timezone.now()
-        self.save()
+        self.completed_calls_count, self.monthly_goal_completed, self.goal_completed_at, _ = (
+            MonthlyDonationTracker.record_completed_call(self.user_id, self.month)
+        )
         return self.monthly_goal_completed
 
-    def reset_for_new_month(self):
+    @classmethod
+    def record_completed_call(cls, user_id, date=None):
+        """Atomically count one completed call and block the user once the goal is reached.
+
+        The increment is a single conditional UPDATE evaluated by the database, so concurrent
+        confirmations never lose counts; the tracker row is only inserted when it is missing.
+        The user is blocked in the same transaction. Returns
+        (completed_calls_count, monthly_goal_completed, goal_completed_at, blocked).
+        """
+        month_start = cls.month_start(date)
+        now = timezone.now()
+        goal_reached = models.Q(completed_calls_count__gte=cls.MONTHLY_CALL_GOAL - 1)
+
+        with transaction.atomic():
+            # Assignments reference only columns assigned after them, so every expression sees
+            # the pre-update row on MySQL (which applies SET left to right) as well as elsewhere.
+            increment = dict(
+                goal_completed_at=models.Case(
+                    models.When(goal_reached & models.Q(monthly_goal_completed=False), then=models.Value(now)),
+                    default=models.F('goal_completed_at')
+                ),
+                monthly_goal_completed=models.Case(
+                    models.When(goal_reached, then=models.Value(True)),
+                    default=models.F('monthly_goal_completed')
+                ),
+                completed_calls_count=models.F('completed_calls_count') + 1,
+                updated_at=now
+            )
+            trackers = cls.objects.filter(user_id=user_id, month=month_start)
+            if not trackers.update(**increment):
+                cls.objects.bulk_create([cls(user_id=user_id, month=month_start)], ignore_conflicts=True)
+                trackers.update(**increment)
+
+            count, goal_completed, completed_at = trackers.values_list(
+                'completed_calls_count', 'monthly_goal_completed', 'goal_completed_at'
+            ).get()
+
+            blocked = False
+            if count >= cls.MONTHLY_CALL_GOAL:
+                blocked = User.objects.filter(id=user_id, is_active=True).update(is_active=False) == 1
+
+            from .services import DonorSearchCache, TrackerSnapshotCache
+
+            if count == cls.MONTHLY_CALL_GOAL or blocked:
+                transaction.on_commit(lambda: DonorSearchCache.invalidate_user(user_id))
+
+            # Only committed counts reach the snapshot. A missing snapshot is created here, and a
+            # callback that arrives after a higher count from a concurrent increment is ignored.
+            transaction.on_commit(lambda: TrackerSnapshotCache.record_increment(
+                user_id, month_start,
+                completed_calls_count=count,
+                monthly_goal_completed=goal_completed,
+                goal_completed_at=completed_at
+            ))
+
+        return count, goal_completed, completed_at, blocked
+
+    def reset_for_new_month(self, notify=True):
         
         was_blocked = self.monthly_goal_completed and not self.user.is_active
         
@@ -592,76 +839,283 @@ class MonthlyDonationTracker(models.Model):
             self.user.save()
             
       
-            if was_blocked:
-                self._send_unblock_email_notification()
+            if was_blocked and notify:
+                _send_unblock_email_notification(self.user, self.month.strftime('%B %Y'))
         
         self.save()
         return self
-    
-    @classmethod
-    def get_or_create_for_user_month(cls, user, date=None):
-    
+
+    @staticmethod
+    def month_start(date=None):
         if date is None:
             date = timezone.now().date()
-        
-        month_start = date.replace(day=1)
-        
-        previous_trackers = cls.objects.filter(
-            user=user,
-            month__lt=month_start,
-            monthly_goal_completed=True
-        ).order_by('-month')
-        
+        return date.replace(day=1)
+
+    @classmethod
+    def for_user_month(cls, user, date=None):
+        """Return the user's tracker for the month, without writing anything.
+
+        Trackers are keyed by month, so a new month rolls over lazily: if no row exists yet the
+        user simply has a fresh, unsaved tracker with zero calls. Returns (tracker, exists).
+        """
+        month_start = cls.month_start(date)
+        tracker = cls.objects.filter(user=user, month=month_start).first()
+        if tracker is not None:
+            return tracker, True
+        return cls(user=user, month=month_start), False
     
-        tracker, created = cls.objects.get_or_create(
-            user=user,
-            month=month_start,
-            defaults={
-                'completed_calls_count': 0,
-                'monthly_goal_completed': False,
-                'goal_completed_at': None
-            }
-        )
-        
-        if not created and tracker.month == month_start:
-            current_month = timezone.now().date().replace(day=1)
-            if tracker.month < current_month:
-                tracker.reset_for_new_month()
-        
-        return tracker, created
+    @classmethod
+    def get_or_create_for_user_month(cls, user, date=None):
+        """Fetch the month's tracker, creating it with a single INSERT when a write needs it."""
+        return cls.objects.get_or_create(user=user, month=cls.month_start(date))
+
+
+
+class MonthlyResetCheckpoint(models.Model):
+
+    month = models.DateField(_('Month'))
+    chunk_start = models.PositiveBigIntegerField(_('Chunk Start User ID'))
+    chunk_end = models.PositiveBigIntegerField(_('Chunk End User ID'))
+    chunk_size = models.PositiveIntegerField(_('Chunk Size'))
+    created_trackers = models.PositiveIntegerField(_('Created Trackers'), default=0)
+    reset_trackers = models.PositiveIntegerField(_('Reset Trackers'), default=0)
+    unblocked_users = models.PositiveIntegerField(_('Unblocked Users'), default=0)
+    queued_emails = models.PositiveIntegerField(_('Queued Emails'), default=0)
+    completed_at = models.DateTimeField(_('Completed At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Monthly Reset Checkpoint')
+        verbose_name_plural = _('Monthly Reset Checkpoints')
+        unique_together = ['month', 'chunk_start']
+        ordering = ['month', 'chunk_start']
+
+    def __str__(self):
+        return f"{self.month.strftime('%B %Y')} users [{self.chunk_start}, {self.chunk_end})"
+
+
+class SchedulerLock(models.Model):
+
+    name = models.CharField(_('Job Name'), max_length=100, unique=True)
+    owner = models.CharField(_('Owner'), max_length=255, blank=True)
+    locked_until = models.DateTimeField(_('Locked Until'), null=True, blank=True)
+    last_slot = models.DateTimeField(_('Last Scheduled Slot'), null=True, blank=True)
+    last_started_at = models.DateTimeField(_('Last Started At'), null=True, blank=True)
+    last_finished_at = models.DateTimeField(_('Last Finished At'), null=True, blank=True)
+    last_status = models.CharField(_('Last Status'), max_length=10, blank=True)
+    last_error = models.TextField(_('Last Error'), blank=True, null=True)
+
+    class Meta:
+        verbose_name = _('Scheduler Lock')
+        verbose_name_plural = _('Scheduler Locks')
 
+    def __str__(self):
+        return f"{self.name} ({self.owner or 'idle'})"
+
+
+class OutboundEmail(models.Model):
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    to_email = models.EmailField(_('To'))
+    from_email = models.CharField(_('From'), max_length=254, blank=True)
+    subject = models.CharField(_('Subject'), max_length=255)
+    body = models.TextField(_('Body'))
+    status = models.CharField(
+        _('Status'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='pending'
+    )
+    attempts = models.PositiveIntegerField(_('Attempts'), default=0)
+    max_attempts = models.PositiveIntegerField(_('Max Attempts'), default=5)
+    next_attempt_at = models.DateTimeField(
+        _('Next Attempt At'),
+        default=timezone.now,
+        help_text='Earliest time a worker may pick this email up (also the lease while sending)'
+    )
+    last_error = models.TextField(_('Last Error'), blank=True, null=True)
+    sent_at = models.DateTimeField(_('Sent At'), null=True, blank=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Outbound Email')
+        verbose_name_plural = _('Outbound Emails')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
+
+
+class AdminBulkAction(models.Model):
+
+    ACTION_CHOICES = [
+        ('block', 'Block users'),
+        ('unblock', 'Unblock users'),
+        ('reset_trackers', 'Reset current month trackers'),
+        ('delete', 'Delete users'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    action = models.CharField(_('Action'), max_length=20, choices=ACTION_CHOICES)
+    target_ids = models.JSONField(
+        _('Target IDs'),
+        default=list,
+        help_text='User ids, or tracker ids for reset_trackers'
+    )
+    status = models.CharField(
+        _('Status'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='pending'
+    )
+    total = models.PositiveIntegerField(_('Total'), default=0)
+    processed = models.PositiveIntegerField(_('Processed'), default=0)
+    affected = models.PositiveIntegerField(_('Affected Rows'), default=0)
+    queued_emails = models.PositiveIntegerField(_('Queued Emails'), default=0)
+    requested_by = models.CharField(_('Requested By'), max_length=254, blank=True)
+    last_error = models.TextField(_('Last Error'), blank=True, null=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    started_at = models.DateTimeField(_('Started At'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('Finished At'), null=True, blank=True)
+    claimed_until = models.DateTimeField(
+        _('Claimed Until'),
+        null=True,
+        blank=True,
+        help_text='Lease of the worker running the job, renewed after every chunk'
+    )
+
+    class Meta:
+        verbose_name = _('Admin Bulk Action')
+        verbose_name_plural = _('Admin Bulk Actions')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_action_display()} #{self.id} ({self.processed}/{self.total}, {self.status})"
+
+
+class IdempotencyRecord(models.Model):
+    """Outcome of a one-time operation, stored under its key so repeats replay it without side effects."""
+
+    key = models.CharField(_('Key'), max_length=100, unique=True)
+    status_code = models.PositiveSmallIntegerField(_('Status Code'), null=True, blank=True)
+    response = models.JSONField(_('Response'), null=True, blank=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Idempotency Record')
+        verbose_name_plural = _('Idempotency Records')
+
+    def __str__(self):
+        return f"{self.key} ({self.status_code})"
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_donor_search_on_profile_save(sender, instance, **kwargs):
+    from .services import DonorSearchCache
+
+    DonorSearchCache.invalidate(instance.blood_group, instance.city)
+    previous_key = getattr(instance, '_search_key', None)
+    if previous_key and previous_key != (instance.blood_group, instance.city):
+        DonorSearchCache.invalidate(*previous_key)
+    instance._search_key = (instance.blood_group, instance.city)
+
+
+@receiver(post_delete, sender=Profile)
+def invalidate_donor_search_on_profile_delete(sender, instance, **kwargs):
+    from .services import DonorSearchCache
+
+    DonorSearchCache.invalidate(instance.blood_group, instance.city)
+
+
+@receiver(post_save, sender=User)
+def invalidate_donor_search_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    from .services import DonorSearchCache
+
+    if created:
+        return
+    if update_fields is not None and not {'is_active', 'is_verified'} & set(update_fields):
+        return
+    DonorSearchCache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=MonthlyDonationTracker)
+def invalidate_donor_search_on_tracker_save(sender, instance, created, update_fields=None, **kwargs):
+    from .services import DonorSearchCache
+
+    if created and not instance.monthly_goal_completed:
+        return
+    if update_fields is not None and 'monthly_goal_completed' not in update_fields:
+        return
+    DonorSearchCache.invalidate_user(instance.user_id)
 
 
 @receiver(post_save, sender=MonthlyDonationTracker)
-def handle_monthly_reset(sender, instance, created, **kwargs):
+def refresh_tracker_snapshot_on_save(sender, instance, **kwargs):
+    from .services import TrackerSnapshotCache
+
+    values = dict(
+        completed_calls_count=instance.completed_calls_count,
+        monthly_goal_completed=instance.monthly_goal_completed,
+        goal_completed_at=instance.goal_completed_at
+    )
+    if MonthlyDonationTracker.user.is_cached(instance):
+        email = instance.user.email
+        transaction.on_commit(lambda: TrackerSnapshotCache.store(TrackerSnapshotCache.build(
+            instance.user_id, email, instance.month, **values
+        )))
+    else:
+        # The user isn't loaded: refresh an existing snapshot (it has the email) rather than query for it.
+        transaction.on_commit(lambda: TrackerSnapshotCache.update(instance.user_id, instance.month, **values))
+
+
+@receiver(post_delete, sender=MonthlyDonationTracker)
+def invalidate_tracker_snapshot_on_delete(sender, instance, **kwargs):
+    from .services import TrackerSnapshotCache
+
+    TrackerSnapshotCache.invalidate([instance.user_id], instance.month)
+
+
+@receiver(post_save, sender=User)
+def invalidate_tracker_snapshot_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    from .services import TrackerSnapshotCache
 
     if created:
-       
-        current_month = instance.month
-        previous_month = (current_month.replace(day=1) - datetime.timedelta(days=1)).replace(day=1)
-        
-        try:
-            prev_tracker = MonthlyDonationTracker.objects.get(
-                user=instance.user,
-                month=previous_month,
-                monthly_goal_completed=True,
-                completed_calls_count__gte=3
-            )
-            
-            if instance.monthly_goal_completed or instance.completed_calls_count > 0:
-                instance.reset_for_new_month()
-                
-                
-                month_year = current_month.strftime('%B %Y')
-                _send_unblock_email_notification(instance.user, month_year)
-                print(f"Auto-reset: User {instance.user.email} unblocked for {month_year}")
-                
-        except MonthlyDonationTracker.DoesNotExist:
-            
-            pass
-        except Exception as e:
-            
-            print(f"Error in monthly reset signal for {instance.user.email}: {e}")
+        return
+    if update_fields is not None and 'email' not in update_fields:
+        return
+    TrackerSnapshotCache.invalidate([instance.pk])
+
+
+@receiver(post_save, sender=Admin)
+@receiver(post_delete, sender=Admin)
+def invalidate_active_admin_cache(sender, instance, **kwargs):
+    from .services import ActiveAdminCache
+
+    ActiveAdminCache.invalidate()
+
+
+@receiver(post_save, sender='token_blacklist.BlacklistedToken')
+def add_revoked_token_to_index(sender, instance, created, **kwargs):
+    from .tokens import RevokedTokenIndex
+
+    if created:
+        RevokedTokenIndex.add(instance.token.jti, instance.token.expires_at)
 
 
 def _send_unblock_email_notification(user, month_year):
@@ -672,9 +1126,9 @@ def _send_unblock_email_notification(user, month_year):
         success, message = EmailService.send_monthly_unblock_notification(user, month_year)
         
         if success:
-            print(f"Unblock email sent to {user.email} for {month_year}")
+            print(f"Unblock email queued for {user.email} for {month_year}")
         else:
-            print(f"Failed to send unblock email to {user.email}: {message}")
+            print(f"Failed to queue unblock email to {user.email}: {message}")
             
     except ImportError:
         print(f"EmailService not available - could not send unblock email to {user.email}")
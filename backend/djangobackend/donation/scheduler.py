@@ -0,0 +1,167 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.db import IntegrityError, connections
+from django.db.models import Q
+from django.utils import timezone
+import datetime
+import logging
+import os
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week.
+
+    Supports '*', lists ('1,15'), ranges ('1-5'), steps ('*/5', '10-50/10') and 0 or 7 for
+    Sunday. As in cron, when both day fields are restricted a day matching either one runs.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {expression!r}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse_field(part, low, high) for part, (low, high) in zip(parts, self.FIELD_RANGES)
+        ]
+        if 7 in self.weekdays:
+            self.weekdays.add(0)
+        self.day_restricted = parts[2] != '*'
+        self.weekday_restricted = parts[4] != '*'
+
+    @staticmethod
+    def _parse_field(field, low, high):
+        values = set()
+        for item in field.split(','):
+            step = 1
+            if '/' in item:
+                item, step = item.split('/')
+                step = int(step)
+            if item == '*':
+                start, end = low, high
+            elif '-' in item:
+                start, end = (int(value) for value in item.split('-'))
+            else:
+                start = end = int(item)
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Cron field {field!r} out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def matches(self, moment):
+        if moment.minute not in self.minutes or moment.hour not in self.hours or moment.month not in self.months:
+            return False
+
+        day_match = moment.day in self.days
+        weekday_match = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+
+class ScheduledJob:
+
+    def __init__(self, name, cron, command, args=None, lock_seconds=300):
+        self.name = name
+        self.schedule = CronSchedule(cron)
+        self.command = command
+        self.args = list(args or [])
+        self.lock_seconds = lock_seconds
+
+    def __str__(self):
+        return f"{self.name} [{self.schedule.expression}] manage.py {self.command} {' '.join(self.args)}".rstrip()
+
+
+def configured_jobs():
+    return [ScheduledJob(**job) for job in getattr(settings, 'SCHEDULER_JOBS', [])]
+
+
+class JobLock:
+    """Database lease that lets exactly one node run a job for a given schedule slot.
+
+    Acquiring is a single conditional UPDATE: it only succeeds if nobody ran this slot yet and
+    the previous run's lease has expired, so a job can neither run twice nor overlap itself.
+    A running job keeps extending its lease with a heartbeat.
+    """
+
+    def __init__(self, job, owner=None):
+        self.job = job
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+
+    def acquire(self, slot):
+        from .models import SchedulerLock
+
+        try:
+            SchedulerLock.objects.get_or_create(name=self.job.name)
+        except IntegrityError:
+            pass
+
+        now = timezone.now()
+        return SchedulerLock.objects.filter(
+            Q(last_slot__isnull=True) | Q(last_slot__lt=slot),
+            Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+            name=self.job.name
+        ).update(
+            owner=self.owner,
+            locked_until=now + datetime.timedelta(seconds=self.job.lock_seconds),
+            last_slot=slot,
+            last_started_at=now
+        ) == 1
+
+    def extend(self):
+        from .models import SchedulerLock
+
+        SchedulerLock.objects.filter(name=self.job.name, owner=self.owner).update(
+            locked_until=timezone.now() + datetime.timedelta(seconds=self.job.lock_seconds)
+        )
+
+    def release(self, error=None):
+        from .models import SchedulerLock
+
+        SchedulerLock.objects.filter(name=self.job.name, owner=self.owner).update(
+            locked_until=None,
+            last_finished_at=timezone.now(),
+            last_status='error' if error else 'ok',
+            last_error=str(error) if error else None
+        )
+
+
+def run_job(job, slot):
+    """Run job for slot if this node wins its lock; returns True if it ran."""
+    lock = JobLock(job)
+    if not lock.acquire(slot):
+        return False
+
+    stop_heartbeat = threading.Event()
+
+    def heartbeat():
+        while not stop_heartbeat.wait(job.lock_seconds / 3):
+            try:
+                lock.extend()
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {job.name} failed: {e}")
+        connections.close_all()
+
+    heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+    heartbeat_thread.start()
+
+    error = None
+    try:
+        logger.info(f"Running scheduled job {job.name} for slot {slot:%Y-%m-%d %H:%M}")
+        call_command(job.command, *job.args)
+        logger.info(f"Scheduled job {job.name} finished")
+    except Exception as e:
+        error = e
+        logger.error(f"Scheduled job {job.name} failed: {e}")
+    finally:
+        stop_heartbeat.set()
+        heartbeat_thread.join()
+        lock.release(error)
+        connections.close_all()
+    return True
@@ -1,8 +1,8 @@
 from rest_framework import serializers
-from .models import User, Profile, DonationRequest, CallLog
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from .models import User, Profile, DonationRequest, CallLog, ArchivedDonationRequest
+from .tokens import CachedBlacklistRefreshToken
 import re
-from django.core.mail import send_mail
-from django.conf import settings
 import logging
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
@@ -33,25 +33,12 @@ class UserSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        user = User.objects.create_user(
+        # UserCreate generates the OTP and queues the verification email.
+        return User.objects.create_user(
             email=validated_data['email'],
             name=validated_data['name'],
             password=validated_data['password']
         )
-        
-        raw_otp = user.generate_otp()
-        
-        try:
-            send_mail(
-                subject='Verify Your Account',
-                message=f'Your OTP: {raw_otp}',
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-            )
-        except Exception as e:
-            logger.error(f"Email send failed: {e}")
-        
-        return user
 class OTPVerifySerializer(serializers.Serializer):
     email = serializers.EmailField()
     otp = serializers.CharField(max_length=6, min_length=6)
@@ -190,7 +177,8 @@ class DonationRequestSerializer(serializers.ModelSerializer):
             'requester': {'read_only': True},
             'created_at': {'read_only': True},
             'updated_at': {'read_only': True},
-            'status': {'read_only': True}
+            'status': {'read_only': True},
+            'expires_at': {'read_only': True}
         }
     
     def create(self, validated_data):
@@ -199,6 +187,20 @@ class DonationRequestSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class DonationRequestListSerializer(DonationRequestSerializer):
+    role = serializers.CharField(read_only=True)
+    archived = serializers.BooleanField(read_only=True)
+
+    class Meta(DonationRequestSerializer.Meta):
+        fields = DonationRequestSerializer.Meta.fields + ['role', 'archived']
+
+
+class ArchivedDonationRequestListSerializer(DonationRequestListSerializer):
+
+    class Meta(DonationRequestListSerializer.Meta):
+        model = ArchivedDonationRequest
+
+
 class CallLogSerializer(serializers.ModelSerializer):
     caller_name = serializers.CharField(source='caller.name', read_only=True)
     receiver_name = serializers.CharField(source='receiver.name', read_only=True)
@@ -206,7 +208,7 @@ class CallLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = CallLog
         fields = [
-            'id', 'caller', 'receiver',
+            'id', 'caller', 'receiver', 'donation_request',
             'caller_name', 'receiver_name', 'call_status', 'duration_seconds',
             'created_at', 'updated_at', 'caller_confirmed', 'receiver_confirmed',
             'both_confirmed', 'email_sent', 'donor_email_response', 'call_method'
@@ -217,9 +219,27 @@ class CallLogSerializer(serializers.ModelSerializer):
             'updated_at': {'read_only': True}
         }
     
+    def validate(self, attrs):
+        donation_request = attrs.get('donation_request')
+        if donation_request is not None:
+            caller = self.context['request'].user
+            if donation_request.requester_id != caller.pk or donation_request.donor_id != attrs['receiver'].pk:
+                raise serializers.ValidationError(
+                    {'donation_request': 'Donation request does not belong to this caller and receiver.'}
+                )
+        return attrs
+    
     def create(self, validated_data):
         
         validated_data['caller'] = self.context['request'].user
+        if validated_data.get('donation_request') is None:
+            # Link the call to the caller's open request to this donor, so confirmation is a PK join.
+            validated_data['donation_request_id'] = DonationRequest.objects.filter(
+                requester=validated_data['caller'],
+                donor=validated_data['receiver'],
+                status__in=DonationRequest.OPEN_STATUSES
+            ).order_by('-id').values_list('id', flat=True).first()
+            validated_data.pop('donation_request', None)
         return super().create(validated_data)
 
 
@@ -235,3 +255,7 @@ class DonationRequestResponseSerializer(serializers.Serializer):
         if value is None:
             raise serializers.ValidationError("Response is required (true for accept, false for decline)")
         return value
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
@@ -1,10 +1,803 @@
 import logging
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.cache import cache
 from django.utils import timezone
+from django.db import transaction, IntegrityError
+from django.db.models import Case, When, Value, IntegerField, Q, F, Exists, OuterRef
+import base64
+import datetime
+import hashlib
+import threading
+import time
 logger = logging.getLogger(__name__)
 
+
+UNIVERSAL_DONOR = 'O-'
+
+# Recipient blood group -> donor blood groups that can safely give to it.
+BLOOD_COMPATIBILITY = {
+    'O-': ('O-',),
+    'O+': ('O+', 'O-'),
+    'A-': ('A-', 'O-'),
+    'A+': ('A+', 'A-', 'O+', 'O-'),
+    'B-': ('B-', 'O-'),
+    'B+': ('B+', 'B-', 'O+', 'O-'),
+    'AB-': ('AB-', 'A-', 'B-', 'O-'),
+    'AB+': ('AB+', 'AB-', 'A+', 'A-', 'B+', 'B-', 'O+', 'O-'),
+}
+
+
+class DonorSearchService:
+
+    SEARCH_MODES = ('exact', 'compatible')
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    # Public field name -> lookup used with .values(); mirrors ProfileSerializer.
+    SEARCH_FIELDS = {
+        'id': 'id',
+        'user': 'user_id',
+        'user_email': 'user__email',
+        'user_name': 'user__name',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'full_name': None,
+        'contact_number': 'contact_number',
+        'address': 'address',
+        'gender': 'gender',
+        'city': 'city',
+        'blood_group': 'blood_group',
+        'role': 'role',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    FULL_NAME_LOOKUPS = ('first_name', 'last_name', 'user__name')
+
+    @staticmethod
+    def compatible_donor_groups(blood_group):
+        return BLOOD_COMPATIBILITY.get(blood_group, ())
+
+    @staticmethod
+    def search_queryset(blood_group, city, mode='exact'):
+        """Eligible donor profiles for a recipient, ranked exact match, universal donor, then other compatible groups.
+
+        Blocked or unverified donors and donors who reached this month's goal are filtered out
+        in the query itself. The result does not depend on who is searching, so search_page can
+        cache it; per-requester exclusions are applied there.
+        """
+        from .models import Profile, MonthlyDonationTracker
+
+        if mode == 'compatible':
+            donor_groups = DonorSearchService.compatible_donor_groups(blood_group)
+        else:
+            donor_groups = (blood_group,)
+
+        current_month = timezone.now().date().replace(day=1)
+
+        queryset = Profile.objects.filter(
+            role='donor',
+            city=city,
+            blood_group__in=donor_groups,
+            user__is_active=True,
+            user__is_verified=True
+        ).exclude(
+            Exists(MonthlyDonationTracker.objects.filter(
+                user=OuterRef('user_id'),
+                month=current_month,
+                monthly_goal_completed=True
+            ))
+        )
+
+        return queryset.annotate(
+            match_rank=Case(
+                When(blood_group=blood_group, then=Value(0)),
+                When(blood_group=UNIVERSAL_DONOR, then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField()
+            )
+        ).select_related('user').order_by('match_rank', 'id')
+
+    @staticmethod
+    def parse_fields(raw_fields):
+        if not raw_fields:
+            return list(DonorSearchService.SEARCH_FIELDS)
+        fields = [field.strip() for field in raw_fields.split(',') if field.strip()]
+        unknown = [field for field in fields if field not in DonorSearchService.SEARCH_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        if 'id' not in fields:
+            fields.insert(0, 'id')
+        return fields
+
+    @staticmethod
+    def parse_page_size(raw_limit):
+        if not raw_limit:
+            return DonorSearchService.DEFAULT_PAGE_SIZE
+        try:
+            limit = int(raw_limit)
+        except (TypeError, ValueError):
+            raise ValueError("limit must be an integer")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        return min(limit, DonorSearchService.MAX_PAGE_SIZE)
+
+    @staticmethod
+    def encode_cursor(match_rank, profile_id):
+        return base64.urlsafe_b64encode(f"{match_rank}:{profile_id}".encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            match_rank, profile_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+            return int(match_rank), int(profile_id)
+        except (ValueError, UnicodeError):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def search_page(blood_group, city, mode='exact', fields=None, cursor=None, limit=DEFAULT_PAGE_SIZE, requester=None):
+        """One keyset page of donors as plain dicts, plus the cursor for the next page (or None).
+
+        Pages are cached per (blood_group, city) generation, so the cached rows never depend on
+        the requester; the requester's own profile and pending requests are filtered afterwards,
+        reading further cached pages until `limit` donors survive or the results run out.
+        """
+        fields = fields or list(DonorSearchService.SEARCH_FIELDS)
+
+        lookups = {'id', 'user_id'}
+        for field in fields:
+            if field == 'full_name':
+                lookups.update(DonorSearchService.FULL_NAME_LOOKUPS)
+            else:
+                lookups.add(DonorSearchService.SEARCH_FIELDS[field])
+
+        donors = []
+        page_cursor = cursor
+        while True:
+            rows, next_cursor = DonorSearchService._cached_page(blood_group, city, mode, lookups, page_cursor, limit)
+            if requester is not None and rows:
+                rows = DonorSearchService._exclude_for_requester(rows, requester)
+            donors.extend(rows)
+            if len(donors) >= limit or next_cursor is None:
+                break
+            page_cursor = next_cursor
+
+        if len(donors) > limit:
+            donors = donors[:limit]
+            next_cursor = DonorSearchService.encode_cursor(donors[-1]['match_rank'], donors[-1]['id'])
+
+        return [DonorSearchService._project(row, fields) for row in donors], next_cursor
+
+    @staticmethod
+    def _cached_page(blood_group, city, mode, lookups, cursor, limit):
+        if mode == 'compatible':
+            donor_groups = DonorSearchService.compatible_donor_groups(blood_group)
+        else:
+            donor_groups = (blood_group,)
+
+        cache_key = DonorSearchCache.page_key(
+            donor_groups, city, (blood_group, mode, cursor, limit, sorted(lookups))
+        )
+        page = cache.get(cache_key)
+
+        if page is None:
+            DonorSearchCache.record('misses')
+            queryset = DonorSearchService.search_queryset(blood_group, city, mode=mode)
+
+            if cursor:
+                match_rank, profile_id = DonorSearchService.decode_cursor(cursor)
+                queryset = queryset.filter(
+                    Q(match_rank__gt=match_rank) | Q(match_rank=match_rank, id__gt=profile_id)
+                )
+
+            rows = list(queryset.values('match_rank', *lookups)[:limit + 1])
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            next_cursor = None
+            if has_more:
+                next_cursor = DonorSearchService.encode_cursor(rows[-1]['match_rank'], rows[-1]['id'])
+
+            page = (rows, next_cursor)
+            cache.set(cache_key, page, DonorSearchCache.timeout())
+        else:
+            DonorSearchCache.record('hits')
+
+        return page
+
+    @staticmethod
+    def _exclude_for_requester(rows, requester):
+        from .models import DonationRequest
+
+        excluded_user_ids = set(DonationRequest.objects.filter(
+            requester=requester,
+            status='pending',
+            donor_id__in=[row['user_id'] for row in rows]
+        ).values_list('donor_id', flat=True))
+        excluded_user_ids.add(requester.pk)
+        return [row for row in rows if row['user_id'] not in excluded_user_ids]
+
+    @staticmethod
+    def _project(row, fields):
+        donor = {}
+        for field in fields:
+            if field == 'full_name':
+                first_name, last_name = row['first_name'], row['last_name']
+                if first_name and last_name:
+                    donor[field] = f"{first_name} {last_name}"
+                else:
+                    donor[field] = first_name or last_name or row['user__name']
+            else:
+                donor[field] = row[DonorSearchService.SEARCH_FIELDS[field]]
+        return donor
+
+
+
+class KeysetPagination:
+    """Cursor pagination on a unique integer key, shared by the admin listings.
+
+    The cursor is the opaque key of the last row returned, so every page is an index range scan
+    ("WHERE id > cursor ORDER BY id LIMIT n") no matter how deep the client pages.
+    """
+
+    @staticmethod
+    def parse_limit(raw_limit, default, maximum):
+        if not raw_limit:
+            return default
+        try:
+            limit = int(raw_limit)
+        except (TypeError, ValueError):
+            raise ValueError("limit must be an integer")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        return min(limit, maximum)
+
+    @staticmethod
+    def encode_cursor(key):
+        return base64.urlsafe_b64encode(str(key).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, UnicodeError):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def page(queryset, cursor=None, limit=50, key='id', descending=False):
+        """Return (rows, next_cursor) for a queryset of dicts or models; next_cursor is None on the last page."""
+        return KeysetPagination.page_merged([queryset], cursor, limit, key, descending)
+
+    @staticmethod
+    def page_merged(querysets, cursor=None, limit=50, key='id', descending=False):
+        """Page several querysets that share a key space (e.g. a hot table and its archive) as one list.
+
+        Each queryset contributes at most limit + 1 rows from its own index range, which are
+        merged in key order, so the cost per page does not grow with either table.
+        """
+        def key_of(row):
+            return row[key] if isinstance(row, dict) else getattr(row, key)
+
+        after = KeysetPagination.decode_cursor(cursor) if cursor else None
+        rows = []
+        for queryset in querysets:
+            if after is not None:
+                queryset = queryset.filter(**{f'{key}__lt' if descending else f'{key}__gt': after})
+            rows.extend(queryset.order_by(f'-{key}' if descending else key)[:limit + 1])
+        rows.sort(key=key_of, reverse=descending)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = KeysetPagination.encode_cursor(key_of(rows[-1]))
+        return rows, next_cursor
+
+
+def parse_bool(value, name):
+    if value is None or value == '':
+        return None
+    if value.lower() in ('true', '1', 'yes'):
+        return True
+    if value.lower() in ('false', '0', 'no'):
+        return False
+    raise ValueError(f"{name} must be true or false")
+
+
+class UserListService:
+
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 500
+    EXPORT_FORMATS = ('ndjson', 'csv')
+    EXPORT_CHUNK_SIZE = 2000
+
+    # Output column -> lookup used with .values().
+    FIELDS = {
+        'id': 'id',
+        'email': 'email',
+        'name': 'name',
+        'is_active': 'is_active',
+        'is_verified': 'is_verified',
+        'date_joined': 'date_joined',
+        'blood_group': 'profile__blood_group',
+        'city': 'profile__city',
+        'role': 'profile__role',
+    }
+
+    @staticmethod
+    def filtered_queryset(params):
+        """Non-staff users matching the request's filters, as .values() rows keyed by FIELDS.
+
+        Raises ValueError for malformed filter values.
+        """
+        from .models import User
+        from django.db.models.functions import Lower
+        from django.utils.dateparse import parse_date, parse_datetime
+
+        queryset = User.objects.filter(is_staff=False)
+
+        for flag in ('is_active', 'is_verified'):
+            value = parse_bool(params.get(flag), flag)
+            if value is not None:
+                queryset = queryset.filter(**{flag: value})
+
+        for field in ('blood_group', 'city', 'role'):
+            value = params.get(field)
+            if value:
+                if field == 'blood_group':
+                    # An unencoded '+' in the query string arrives as a space.
+                    value = value.replace(' ', '+').strip()
+                queryset = queryset.filter(**{f'profile__{field}': value})
+
+        joined_after = params.get('joined_after')
+        if joined_after:
+            moment = parse_datetime(joined_after)
+            if moment is None:
+                day = parse_date(joined_after)
+                if day is None:
+                    raise ValueError("joined_after must be an ISO date or datetime")
+                moment = datetime.datetime.combine(day, datetime.time.min)
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment)
+            queryset = queryset.filter(date_joined__gte=moment)
+
+        search = (params.get('search') or '').strip().lower()
+        if search:
+            # Prefix match on the lower-cased columns so the functional indexes can be used.
+            queryset = queryset.annotate(email_ci=Lower('email'), name_ci=Lower('name')).filter(
+                Q(email_ci__startswith=search) | Q(name_ci__startswith=search)
+            )
+
+        plain = [name for name, lookup in UserListService.FIELDS.items() if name == lookup]
+        renamed = {name: F(lookup) for name, lookup in UserListService.FIELDS.items() if name != lookup}
+        return queryset.values(*plain, **renamed)
+
+    @staticmethod
+    def export_rows(queryset):
+        """Stream rows in id order with a server-side cursor instead of loading them all."""
+        return queryset.order_by('id').iterator(chunk_size=UserListService.EXPORT_CHUNK_SIZE)
+
+
+
+class BlockedProfileService:
+
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+    CURRENTLY_BLOCKED = 'Currently Blocked'
+    PREVIOUSLY_BLOCKED = 'Previously Blocked (Unblocked)'
+
+    @staticmethod
+    def filtered_queryset(params):
+        """Trackers that reached the monthly goal, projected to the blocked-profile row shape in SQL.
+
+        Rows are keyed by tracker_id for pagination; blocking_status and is_current_month are
+        computed by the database. Raises ValueError for malformed filter values.
+        """
+        from .models import MonthlyDonationTracker
+        from django.db.models import BooleanField, CharField
+
+        current_month = timezone.now().date().replace(day=1)
+        queryset = MonthlyDonationTracker.objects.filter(
+            monthly_goal_completed=True,
+            completed_calls_count__gte=MonthlyDonationTracker.MONTHLY_CALL_GOAL
+        )
+
+        if parse_bool(params.get('current_month'), 'current_month'):
+            queryset = queryset.filter(month=current_month)
+
+        currently_blocked = parse_bool(params.get('currently_blocked'), 'currently_blocked')
+        if currently_blocked is not None:
+            queryset = queryset.filter(user__is_active=not currently_blocked)
+
+        return queryset.values(
+            'user_id',
+            'completed_calls_count',
+            'goal_completed_at',
+            'monthly_goal_completed',
+            tracker_id=F('id'),
+            email=F('user__email'),
+            name=F('user__name'),
+            is_active=F('user__is_active'),
+            is_verified=F('user__is_verified'),
+            date_joined=F('user__date_joined'),
+            blocked_month=F('month'),
+            blocking_status=Case(
+                When(user__is_active=False, then=Value(BlockedProfileService.CURRENTLY_BLOCKED)),
+                default=Value(BlockedProfileService.PREVIOUSLY_BLOCKED),
+                output_field=CharField()
+            ),
+            is_current_month=Case(
+                When(month=current_month, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            ),
+        )
+
+
+class DonorSearchCache:
+    """Generation-keyed cache for donor search pages.
+
+    Every (blood_group, city) pair has a generation counter that is part of the page cache key.
+    Bumping the counter makes every cached page for that pair unreachable, so reads never
+    return stale donors; the orphaned entries simply expire. A global generation covers bulk
+    updates where the affected pairs are not known.
+    """
+
+    KEY_PREFIX = 'donor_search'
+    GLOBAL_GENERATION = 'all'
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'DONOR_SEARCH_CACHE_TIMEOUT', 300)
+
+    @staticmethod
+    def _generation_key(blood_group, city):
+        return f"{DonorSearchCache.KEY_PREFIX}:gen:{blood_group}:{city}"
+
+    @staticmethod
+    def _global_generation_key():
+        return f"{DonorSearchCache.KEY_PREFIX}:gen:{DonorSearchCache.GLOBAL_GENERATION}"
+
+    @staticmethod
+    def _generations(keys):
+        generations = cache.get_many(keys)
+        for key in keys:
+            if key not in generations:
+                # A nanosecond timestamp can't collide with a generation handed out before eviction.
+                cache.add(key, time.time_ns(), None)
+                generations[key] = cache.get(key)
+        return [generations[key] for key in keys]
+
+    @staticmethod
+    def page_key(donor_groups, city, params):
+        keys = [DonorSearchCache._global_generation_key()]
+        keys += [DonorSearchCache._generation_key(group, city) for group in donor_groups]
+        generations = DonorSearchCache._generations(keys)
+        digest = hashlib.md5(repr((generations, city, params)).encode()).hexdigest()
+        return f"{DonorSearchCache.KEY_PREFIX}:page:{digest}"
+
+    @staticmethod
+    def _bump(key):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
+
+    @staticmethod
+    def invalidate(blood_group, city):
+        if blood_group and city:
+            DonorSearchCache._bump(DonorSearchCache._generation_key(blood_group, city))
+
+    @staticmethod
+    def invalidate_user(user_id):
+        from .models import Profile
+
+        profile = Profile.objects.filter(user_id=user_id).values('blood_group', 'city').first()
+        if profile:
+            DonorSearchCache.invalidate(profile['blood_group'], profile['city'])
+
+    @staticmethod
+    def invalidate_all():
+        DonorSearchCache._bump(DonorSearchCache._global_generation_key())
+
+    @staticmethod
+    def record(outcome):
+        key = f"{DonorSearchCache.KEY_PREFIX}:stats:{outcome}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 0, None)
+            cache.incr(key)
+
+    @staticmethod
+    def stats():
+        hits_key = f"{DonorSearchCache.KEY_PREFIX}:stats:hits"
+        misses_key = f"{DonorSearchCache.KEY_PREFIX}:stats:misses"
+        counters = cache.get_many([hits_key, misses_key])
+        hits = counters.get(hits_key, 0)
+        misses = counters.get(misses_key, 0)
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else None
+        }
+
+
+
+class TrackerSnapshotCache:
+    """Cached monthly tracker snapshot per (user, month) for the polled tracker endpoints.
+
+    Writers refresh the snapshot as part of the write (write-through), so a read is a single
+    cache get with no database work. Lookups by email go through a small email -> user id alias.
+    Keys include the month, so a new month starts with a miss and rolls over lazily.
+    """
+
+    KEY_PREFIX = 'tracker_snapshot'
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'TRACKER_SNAPSHOT_CACHE_TIMEOUT', 3600)
+
+    @staticmethod
+    def _month(month=None):
+        return (month or timezone.now().date()).replace(day=1)
+
+    @staticmethod
+    def key(user_id, month=None):
+        month = TrackerSnapshotCache._month(month)
+        return f"{TrackerSnapshotCache.KEY_PREFIX}:{user_id}:{month:%Y-%m}"
+
+    @staticmethod
+    def email_key(email):
+        digest = hashlib.md5(email.encode()).hexdigest()
+        return f"{TrackerSnapshotCache.KEY_PREFIX}:email:{digest}"
+
+    @staticmethod
+    def build(user_id, user_email, month, completed_calls_count, monthly_goal_completed, goal_completed_at):
+        snapshot = {
+            'user_id': user_id,
+            'user_email': user_email,
+            'month': month.isoformat(),
+            'completed_calls_count': completed_calls_count,
+            'monthly_goal_completed': monthly_goal_completed,
+            'goal_completed_at': goal_completed_at.isoformat() if goal_completed_at else None,
+        }
+        snapshot['etag'] = '"' + hashlib.md5(repr(sorted(snapshot.items())).encode()).hexdigest() + '"'
+        return snapshot
+
+    @staticmethod
+    def store(snapshot):
+        cache.set_many(
+            {
+                TrackerSnapshotCache.key(snapshot['user_id'], datetime.date.fromisoformat(snapshot['month'])): snapshot,
+                TrackerSnapshotCache.email_key(snapshot['user_email']): snapshot['user_id'],
+            },
+            TrackerSnapshotCache.timeout()
+        )
+        return snapshot
+
+    @staticmethod
+    def add(snapshot):
+        """Store a snapshot only if none is cached; returns whichever snapshot ends up cached."""
+        key = TrackerSnapshotCache.key(snapshot['user_id'], datetime.date.fromisoformat(snapshot['month']))
+        if not cache.add(key, snapshot, TrackerSnapshotCache.timeout()):
+            return cache.get(key) or snapshot
+        cache.set(TrackerSnapshotCache.email_key(snapshot['user_email']), snapshot['user_id'], TrackerSnapshotCache.timeout())
+        return snapshot
+
+    @staticmethod
+    def record_increment(user_id, month, **fields):
+        """Write a committed increment through, creating the snapshot when none is cached yet.
+
+        A concurrent read-through may be about to cache an older count; it only ever adds, so
+        the increment's snapshot wins whichever order the two arrive in.
+        """
+        from .models import User
+
+        if TrackerSnapshotCache.update(user_id, month, only_if_newer=True, **fields) is not None:
+            return
+        email = User.objects.filter(id=user_id).values_list('email', flat=True).first()
+        if email is None:
+            return
+        snapshot = TrackerSnapshotCache.build(user_id, email, TrackerSnapshotCache._month(month), **fields)
+        if TrackerSnapshotCache.add(snapshot) is not snapshot:
+            # Another writer cached a snapshot in between; merge into it unless it is newer.
+            TrackerSnapshotCache.update(user_id, month, only_if_newer=True, **fields)
+
+    @staticmethod
+    def update(user_id, month, only_if_newer=False, **fields):
+        """Write new tracker values through to an existing snapshot; a missing one is left for the next read.
+
+        Increments are reported after commit and may arrive out of order; with only_if_newer a
+        count lower than the cached one is ignored.
+        """
+        snapshot = cache.get(TrackerSnapshotCache.key(user_id, month))
+        if snapshot is None:
+            return None
+        if only_if_newer and fields['completed_calls_count'] < snapshot['completed_calls_count']:
+            return snapshot
+        values = {key: snapshot[key] for key in ('completed_calls_count', 'monthly_goal_completed')}
+        values['goal_completed_at'] = snapshot['goal_completed_at'] and datetime.datetime.fromisoformat(snapshot['goal_completed_at'])
+        values.update(fields)
+        return TrackerSnapshotCache.store(TrackerSnapshotCache.build(
+            user_id, snapshot['user_email'], TrackerSnapshotCache._month(month), **values
+        ))
+
+    @staticmethod
+    def get(user_id, month=None):
+        return cache.get(TrackerSnapshotCache.key(user_id, month))
+
+    @staticmethod
+    def get_by_email(email, month=None):
+        user_id = cache.get(TrackerSnapshotCache.email_key(email))
+        if user_id is None:
+            return None
+        snapshot = TrackerSnapshotCache.get(user_id, month)
+        if snapshot is None or snapshot['user_email'] != email:
+            return None
+        return snapshot
+
+    @staticmethod
+    def load(user, month=None):
+        """Read-through: the cached snapshot, or one built from the database and cached.
+
+        The built snapshot is only added, never overwriting one that a concurrent increment
+        wrote after this read hit the database.
+        """
+        from .models import MonthlyDonationTracker
+
+        snapshot = TrackerSnapshotCache.get(user.id, month)
+        if snapshot is not None:
+            return snapshot
+        tracker, _ = MonthlyDonationTracker.for_user_month(user, month)
+        return TrackerSnapshotCache.add(TrackerSnapshotCache.build(
+            user.id, user.email, tracker.month, tracker.completed_calls_count,
+            tracker.monthly_goal_completed, tracker.goal_completed_at
+        ))
+
+    @staticmethod
+    def invalidate(user_ids, month=None):
+        cache.delete_many([TrackerSnapshotCache.key(user_id, month) for user_id in user_ids])
+
+
+
+class ActiveAdminCache:
+    """In-process set of active admin ids so admin_required needs no query per request.
+
+    The set is reloaded with one query when its TTL expires. Admin save/delete signals clear it
+    immediately in the process that made the change; other workers pick the change up within
+    ADMIN_AUTH_CACHE_TTL seconds.
+    """
+
+    _lock = threading.Lock()
+    _active_ids = None
+    _expires_at = 0.0
+
+    @staticmethod
+    def ttl():
+        return getattr(settings, 'ADMIN_AUTH_CACHE_TTL', 30)
+
+    @classmethod
+    def active_ids(cls):
+        ids = cls._active_ids
+        if ids is not None and time.monotonic() < cls._expires_at:
+            return ids
+
+        from .models import Admin
+
+        with cls._lock:
+            if cls._active_ids is None or time.monotonic() >= cls._expires_at:
+                cls._active_ids = frozenset(Admin.objects.filter(is_active=True).values_list('id', flat=True))
+                cls._expires_at = time.monotonic() + cls.ttl()
+            return cls._active_ids
+
+    @classmethod
+    def is_active(cls, admin_id):
+        return admin_id in cls.active_ids()
+
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._active_ids = None
+
+
 class DonationRequestService:
+
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+    LIST_ROLES = ('requester', 'donor')
+
+    @staticmethod
+    def list_queryset(user, statuses=None, role=None, archived=False):
+        """Requests the user made or received, as one query with both users joined in.
+
+        Each row carries a role annotation ('requester' or 'donor') from the user's point of view.
+        With archived=True the same rows are read from ArchivedDonationRequest instead.
+        """
+        from .models import DonationRequest, ArchivedDonationRequest
+        from django.db.models import CharField
+
+        model = ArchivedDonationRequest if archived else DonationRequest
+        if role == 'requester':
+            queryset = model.objects.filter(requester=user)
+        elif role == 'donor':
+            queryset = model.objects.filter(donor=user)
+        else:
+            queryset = model.objects.filter(Q(requester=user) | Q(donor=user))
+
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+
+        return queryset.select_related('requester', 'donor').only(
+            'id', 'blood_group', 'status', 'user_response', 'donor_response', 'notes',
+            'created_at', 'updated_at', 'expires_at',
+            'requester__id', 'requester__name', 'requester__email',
+            'donor__id', 'donor__name', 'donor__email',
+        ).annotate(
+            role=Case(
+                When(requester=user, then=Value('requester')),
+                default=Value('donor'),
+                output_field=CharField()
+            ),
+            archived=Value(archived)
+        )
+
+    @staticmethod
+    def parse_statuses(raw_statuses):
+        from .models import DonationRequest
+
+        if not raw_statuses:
+            return None
+        statuses = [value.strip() for value in raw_statuses.split(',') if value.strip()]
+        valid = {choice for choice, _ in DonationRequest.STATUS_CHOICES}
+        unknown = [value for value in statuses if value not in valid]
+        if unknown:
+            raise ValueError(f"Unknown status: {', '.join(unknown)}")
+        return statuses
+    
+    @staticmethod
+    def expired_queryset(now=None):
+        from .models import DonationRequest
+
+        return DonationRequest.objects.filter(
+            status__in=DonationRequest.EXPIRABLE_STATUSES,
+            expires_at__lte=now or timezone.now()
+        )
+
+    @staticmethod
+    def expire_batch(batch_size, now=None):
+        """Cancel up to batch_size expired open requests in one short transaction.
+
+        Rows are picked through the (status, expires_at) index and locked with SKIP LOCKED, so a
+        request a user is answering right now is left for the next batch. Each status group is
+        cancelled with one UPDATE and logged with one history insert. Returns the number cancelled.
+        """
+        from .models import DonationRequest, DonationRequestTransition
+
+        now = now or timezone.now()
+        with transaction.atomic():
+            rows = list(
+                DonationRequestService.expired_queryset(now).select_for_update(skip_locked=True)
+                .order_by().values_list('id', 'status')[:batch_size]
+            )
+            by_status = {}
+            for request_id, from_status in rows:
+                by_status.setdefault(from_status, []).append(request_id)
+
+            expired = 0
+            for from_status, ids in by_status.items():
+                expired += DonationRequest.objects.filter(id__in=ids, status=from_status).update(
+                    status='cancelled', updated_at=now
+                )
+                DonationRequestTransition.objects.bulk_create([
+                    DonationRequestTransition(
+                        donation_request_id=request_id,
+                        event='expire',
+                        from_status=from_status,
+                        to_status='cancelled'
+                    )
+                    for request_id in ids
+                ])
+        return expired
     
     @staticmethod
     def create_donation_request(requester, donor, blood_group, notes=''):
@@ -41,11 +834,11 @@ class DonationRequestService:
             try:
                 success, message = EmailService.send_donation_reminder_email(donor, donation_request)
                 if success:
-                    logger.info(f"Notification email sent to donor {donor.email} for donation request {donation_request.id}")
+                    logger.info(f"Notification email queued for donor {donor.email} for donation request {donation_request.id}")
                 else:
-                    logger.warning(f"Failed to send notification email to donor {donor.email}: {message}")
+                    logger.warning(f"Failed to queue notification email to donor {donor.email}: {message}")
             except Exception as email_error:
-                logger.error(f"Error sending notification email: {str(email_error)}")
+                logger.error(f"Error queueing notification email: {str(email_error)}")
             
             return donation_request
             
@@ -88,17 +881,576 @@ class DonationRequestService:
                 Blood Donation Team
                 '''
             
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[donation_request.requester.email],
-                fail_silently=False,
-            )
+            EmailService.queue_email(subject, message, donation_request.requester.email)
             
-            logger.info(f"Response notification sent to requester {donation_request.requester.email}")
-            return True, "Response notification sent successfully"
+            logger.info(f"Response notification queued for requester {donation_request.requester.email}")
+            return True, "Response notification queued successfully"
             
         except Exception as e:
             logger.error(f"Failed to send response notification: {str(e)}")
             return False, str(e)
+
+
+class MonthlyResetService:
+    """Set-based monthly reset: a handful of statements per run instead of several queries per user."""
+
+    @staticmethod
+    def reset_month(target_month, force=False, dry_run=False, user_id_range=None):
+        """Re-activate users blocked last month for target_month and queue their unblock emails.
+
+        Creates the missing trackers for target_month with one bulk INSERT, re-activates the users
+        with one UPDATE and queues every notification with one bulk INSERT, all in one
+        transaction. With force, trackers that already completed target_month are reset as well.
+        user_id_range=(start, end) limits the run to user ids in [start, end).
+        Returns row counts and per-phase timings in seconds.
+        """
+        from .models import MonthlyDonationTracker, User
+        from .email_config import EmailService
+
+        previous_month = (target_month - datetime.timedelta(days=1)).replace(day=1)
+        month_year = target_month.strftime('%B %Y')
+        timings = {}
+        stats = {
+            'created_trackers': 0,
+            'reset_trackers': 0,
+            'unblocked_users': 0,
+            'queued_emails': 0,
+        }
+
+        def scoped(queryset, field='user_id'):
+            if user_id_range is None:
+                return queryset
+            start, end = user_id_range
+            return queryset.filter(**{f'{field}__gte': start, f'{field}__lt': end})
+
+        blocked_previous = scoped(MonthlyDonationTracker.objects.filter(
+            month=previous_month,
+            monthly_goal_completed=True,
+            completed_calls_count__gte=3
+        ))
+        completed_current = scoped(MonthlyDonationTracker.objects.filter(
+            month=target_month,
+            monthly_goal_completed=True,
+            completed_calls_count__gte=3
+        ))
+
+        if force:
+            reset_users = Q(id__in=blocked_previous.values('user_id')) | Q(id__in=completed_current.values('user_id'))
+        else:
+            reset_users = Q(id__in=blocked_previous.values('user_id')) & ~Q(id__in=completed_current.values('user_id'))
+
+        users_to_unblock = scoped(User.objects.filter(reset_users, is_active=False, is_staff=False), field='id')
+        missing_tracker_user_ids = blocked_previous.exclude(
+            user_id__in=MonthlyDonationTracker.objects.filter(month=target_month).values('user_id')
+        ).values_list('user_id', flat=True)
+
+        with transaction.atomic():
+            started = time.monotonic()
+            new_tracker_user_ids = list(missing_tracker_user_ids)
+            unblocked = list(users_to_unblock.select_for_update().values('id', 'email', 'name'))
+            timings['select'] = time.monotonic() - started
+
+            if dry_run:
+                stats['created_trackers'] = len(new_tracker_user_ids)
+                stats['reset_trackers'] = completed_current.count() if force else 0
+                stats['unblocked_users'] = len(unblocked)
+                stats['queued_emails'] = len(unblocked)
+                return stats, timings
+
+            # Runs before the tracker reset below, which would otherwise empty the force condition.
+            started = time.monotonic()
+            stats['unblocked_users'] = users_to_unblock.update(is_active=True)
+            timings['unblock_users'] = time.monotonic() - started
+
+            started = time.monotonic()
+            created = MonthlyDonationTracker.objects.bulk_create(
+                [MonthlyDonationTracker(user_id=user_id, month=target_month) for user_id in new_tracker_user_ids],
+                batch_size=1000,
+                ignore_conflicts=True
+            )
+            stats['created_trackers'] = len(created)
+            timings['create_trackers'] = time.monotonic() - started
+
+            if force:
+                started = time.monotonic()
+                reset_user_ids = list(completed_current.values_list('user_id', flat=True))
+                transaction.on_commit(lambda: TrackerSnapshotCache.invalidate(reset_user_ids, target_month))
+                stats['reset_trackers'] = completed_current.update(
+                    completed_calls_count=0,
+                    monthly_goal_completed=False,
+                    goal_completed_at=None,
+                    updated_at=timezone.now()
+                )
+                timings['reset_trackers'] = time.monotonic() - started
+
+            started = time.monotonic()
+            stats['queued_emails'] = EmailService.queue_emails(
+                EmailService.monthly_unblock_message(user['name'], month_year) + (user['email'],)
+                for user in unblocked
+            )
+            timings['queue_emails'] = time.monotonic() - started
+
+            transaction.on_commit(DonorSearchCache.invalidate_all)
+
+        return stats, timings
+
+    @staticmethod
+    def chunk_ranges(chunk_size):
+        """Fixed [start, end) user id ranges covering every user, aligned to multiples of chunk_size."""
+        from .models import User
+        from django.db.models import Max
+
+        max_id = User.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+        return [(start, start + chunk_size) for start in range(0, max_id + 1, chunk_size)]
+
+    @staticmethod
+    def reset_chunk(target_month, chunk_start, chunk_end, force=False):
+        """Reset one user id range and record its checkpoint in the same transaction.
+
+        The checkpoint row is inserted first, so a concurrent run blocks on its unique key and
+        then skips the chunk. Returns the chunk stats, or None if it was already done.
+        """
+        from .models import MonthlyResetCheckpoint
+
+        try:
+            with transaction.atomic():
+                checkpoint = MonthlyResetCheckpoint.objects.create(
+                    month=target_month,
+                    chunk_start=chunk_start,
+                    chunk_end=chunk_end,
+                    chunk_size=chunk_end - chunk_start
+                )
+                stats, _ = MonthlyResetService.reset_month(
+                    target_month,
+                    force=force,
+                    user_id_range=(chunk_start, chunk_end)
+                )
+                for field, value in stats.items():
+                    setattr(checkpoint, field, value)
+                checkpoint.save(update_fields=list(stats))
+        except IntegrityError:
+            return None
+        return stats
+
+
+class AdminBulkActionService:
+    """Set-based admin account actions; large selections run as AdminBulkAction background jobs.
+
+    Each action is one UPDATE (or one cascading DELETE) per chunk of ids, and unblock
+    notifications are queued with a single bulk INSERT into the email outbox.
+    """
+
+    CHUNK_SIZE = 500
+
+    @staticmethod
+    def sync_limit():
+        return getattr(settings, 'ADMIN_BULK_ACTION_SYNC_LIMIT', 200)
+
+    @staticmethod
+    def lease():
+        return datetime.timedelta(seconds=getattr(settings, 'ADMIN_BULK_ACTION_LEASE_SECONDS', 300))
+
+    @staticmethod
+    def block_users(user_ids):
+        from .models import User
+
+        with transaction.atomic():
+            blocked = User.objects.filter(id__in=user_ids, is_active=True, is_staff=False).update(is_active=False)
+            if blocked:
+                transaction.on_commit(DonorSearchCache.invalidate_all)
+        return {'affected': blocked, 'queued_emails': 0}
+
+    @staticmethod
+    def unblock_users(user_ids):
+        from .models import User
+        from .email_config import EmailService
+
+        month_year = timezone.now().strftime('%B %Y')
+        with transaction.atomic():
+            users = User.objects.filter(id__in=user_ids, is_active=False, is_staff=False)
+            unblocked = list(users.select_for_update().values('id', 'email', 'name'))
+            users.filter(id__in=[user['id'] for user in unblocked]).update(is_active=True)
+            queued = EmailService.queue_emails(
+                EmailService.monthly_unblock_message(user['name'], month_year) + (user['email'],)
+                for user in unblocked
+            )
+            if unblocked:
+                transaction.on_commit(DonorSearchCache.invalidate_all)
+        return {'affected': len(unblocked), 'queued_emails': queued}
+
+    @staticmethod
+    def reset_trackers(tracker_ids):
+        """Reset current-month trackers and unblock their users, as reset_for_new_month does per row."""
+        from .models import MonthlyDonationTracker, User
+        from .email_config import EmailService
+
+        current_month = timezone.now().date().replace(day=1)
+        month_year = current_month.strftime('%B %Y')
+        with transaction.atomic():
+            trackers = MonthlyDonationTracker.objects.filter(id__in=tracker_ids, month=current_month)
+            rows = list(trackers.select_for_update().values('user_id', 'monthly_goal_completed'))
+            user_ids = [row['user_id'] for row in rows]
+            completed_user_ids = [row['user_id'] for row in rows if row['monthly_goal_completed']]
+
+            reset = trackers.update(
+                completed_calls_count=0,
+                monthly_goal_completed=False,
+                goal_completed_at=None,
+                updated_at=timezone.now()
+            )
+            users = User.objects.filter(id__in=user_ids, is_active=False)
+            notify = list(users.filter(id__in=completed_user_ids).values('email', 'name'))
+            users.update(is_active=True)
+            queued = EmailService.queue_emails(
+                EmailService.monthly_unblock_message(user['name'], month_year) + (user['email'],)
+                for user in notify
+            )
+            transaction.on_commit(lambda: TrackerSnapshotCache.invalidate(user_ids, current_month))
+            transaction.on_commit(DonorSearchCache.invalidate_all)
+        return {'affected': reset, 'queued_emails': queued}
+
+    @staticmethod
+    def delete_users(user_ids):
+        from .models import User
+
+        with transaction.atomic():
+            users = User.objects.filter(id__in=user_ids, is_staff=False)
+            deleted = users.count()
+            users.delete()
+        return {'affected': deleted, 'queued_emails': 0}
+
+    ACTIONS = {
+        'block': block_users,
+        'unblock': unblock_users,
+        'reset_trackers': reset_trackers,
+        'delete': delete_users,
+    }
+
+    @staticmethod
+    def run(action, ids):
+        """Apply action to ids in chunks; returns the summed affected and queued_emails counts."""
+        totals = {'affected': 0, 'queued_emails': 0}
+        for start in range(0, len(ids), AdminBulkActionService.CHUNK_SIZE):
+            stats = AdminBulkActionService.ACTIONS[action](ids[start:start + AdminBulkActionService.CHUNK_SIZE])
+            for key, value in stats.items():
+                totals[key] += value
+        return totals
+
+    @staticmethod
+    def submit(action, ids, requested_by=''):
+        """Run small selections now; queue large ones. Returns (stats, None) or (None, job)."""
+        from .models import AdminBulkAction
+
+        ids = sorted(set(ids))
+        if len(ids) <= AdminBulkActionService.sync_limit():
+            return AdminBulkActionService.run(action, ids), None
+        job = AdminBulkAction.objects.create(
+            action=action,
+            target_ids=ids,
+            total=len(ids),
+            requested_by=requested_by
+        )
+        return None, job
+
+    @staticmethod
+    def claim_job():
+        """Claim the oldest pending job, or a running one whose worker's lease has expired."""
+        from .models import AdminBulkAction
+
+        now = timezone.now()
+        with transaction.atomic():
+            job = AdminBulkAction.objects.select_for_update(skip_locked=True).filter(
+                Q(status='pending') | Q(status='running', claimed_until__lt=now)
+            ).order_by('created_at').first()
+            if job is None:
+                return None
+            if job.status == 'running':
+                logger.warning(f"Admin bulk action {job.id} lost its worker, resuming at {job.processed}/{job.total}")
+            job.status = 'running'
+            job.started_at = job.started_at or now
+            job.claimed_until = now + AdminBulkActionService.lease()
+            job.save(update_fields=['status', 'started_at', 'claimed_until'])
+        return job
+
+    @staticmethod
+    def process_job(job):
+        """Work through a claimed job chunk by chunk, recording progress after each chunk.
+
+        Progress is persisted together with a renewed lease, so a job whose worker died is
+        picked up again by claim_job and resumes where it stopped; every action is idempotent
+        for rows it already handled. Progress writes are conditional on the lease this worker
+        holds, so a worker that stalled past its lease stops instead of racing the new one.
+        """
+        from .models import AdminBulkAction
+
+        jobs = AdminBulkAction.objects.filter(id=job.id)
+        try:
+            ids = job.target_ids
+            for start in range(job.processed, len(ids), AdminBulkActionService.CHUNK_SIZE):
+                chunk = ids[start:start + AdminBulkActionService.CHUNK_SIZE]
+                stats = AdminBulkActionService.ACTIONS[job.action](chunk)
+                claimed_until = timezone.now() + AdminBulkActionService.lease()
+                renewed = jobs.filter(status='running', claimed_until=job.claimed_until).update(
+                    processed=start + len(chunk),
+                    affected=F('affected') + stats['affected'],
+                    queued_emails=F('queued_emails') + stats['queued_emails'],
+                    claimed_until=claimed_until
+                )
+                if not renewed:
+                    logger.warning(f"Admin bulk action {job.id} was taken over by another worker, stopping")
+                    job.refresh_from_db()
+                    return job
+                job.claimed_until = claimed_until
+            jobs.filter(claimed_until=job.claimed_until).update(
+                status='done', finished_at=timezone.now(), last_error=None, claimed_until=None
+            )
+        except Exception as e:
+            logger.error(f"Admin bulk action {job.id} ({job.action}) failed: {str(e)}")
+            jobs.filter(claimed_until=job.claimed_until).update(
+                status='failed', finished_at=timezone.now(), last_error=str(e), claimed_until=None
+            )
+        job.refresh_from_db()
+        return job
+
+
+class ArchiveService:
+    """Moves terminal DonationRequest and CallLog rows into their archive tables in batches."""
+
+    @staticmethod
+    def cutoff(days=None):
+        if days is None:
+            days = settings.ARCHIVE_AFTER_DAYS
+        return timezone.now() - datetime.timedelta(days=days)
+
+    @staticmethod
+    def archivable_requests(cutoff):
+        from .models import DonationRequest
+
+        return DonationRequest.objects.filter(
+            status__in=DonationRequest.TERMINAL_STATUSES,
+            updated_at__lt=cutoff
+        )
+
+    @staticmethod
+    def archivable_call_logs(cutoff):
+        from .models import CallLog
+
+        return CallLog.objects.filter(
+            Q(call_status__in=CallLog.FINISHED_CALL_STATUSES) | Q(donor_email_response__in=['yes', 'no']),
+            updated_at__lt=cutoff
+        )
+
+    @staticmethod
+    def _copy(rows, archive_model, extra=None):
+        """Build archive instances from hot rows, copying every column the two models share."""
+        if not rows:
+            return []
+        source_fields = {field.attname for field in rows[0]._meta.concrete_fields}
+        fields = [field.attname for field in archive_model._meta.concrete_fields if field.attname in source_fields]
+        return [
+            archive_model(
+                **{name: getattr(row, name) for name in fields},
+                **(extra(row) if extra else {})
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def archive_requests_batch(cutoff, batch_size):
+        """Archive one batch of terminal requests, together with their transition history.
+
+        Copy and delete happen in one transaction and the copy ignores rows already archived,
+        so an interrupted run is simply resumed by the next one. Returns the number archived.
+        """
+        from .models import DonationRequest, DonationRequestTransition, ArchivedDonationRequest
+
+        with transaction.atomic():
+            rows = list(
+                ArchiveService.archivable_requests(cutoff).select_for_update(skip_locked=True)
+                .order_by()[:batch_size]
+            )
+            if not rows:
+                return 0
+            ids = [row.id for row in rows]
+
+            history = {}
+            for transition in DonationRequestTransition.objects.filter(
+                donation_request_id__in=ids
+            ).order_by('created_at', 'id').values(
+                'donation_request_id', 'event', 'from_status', 'to_status', 'actor_id', 'created_at'
+            ):
+                request_id = transition.pop('donation_request_id')
+                transition['created_at'] = transition['created_at'].isoformat()
+                history.setdefault(request_id, []).append(transition)
+
+            ArchivedDonationRequest.objects.bulk_create(
+                ArchiveService._copy(rows, ArchivedDonationRequest, lambda row: {'transitions': history.get(row.id, [])}),
+                ignore_conflicts=True
+            )
+            DonationRequestTransition.objects.filter(donation_request_id__in=ids).delete()
+            DonationRequest.objects.filter(id__in=ids).delete()
+        return len(ids)
+
+    @staticmethod
+    def archive_call_logs_batch(cutoff, batch_size):
+        from .models import CallLog, ArchivedCallLog
+
+        with transaction.atomic():
+            rows = list(
+                ArchiveService.archivable_call_logs(cutoff).select_for_update(skip_locked=True)
+                .order_by()[:batch_size]
+            )
+            if not rows:
+                return 0
+            ArchivedCallLog.objects.bulk_create(ArchiveService._copy(rows, ArchivedCallLog), ignore_conflicts=True)
+            CallLog.objects.filter(id__in=[row.id for row in rows]).delete()
+        return len(rows)
+
+
+class DonorConfirmationService:
+    """Processes the yes/no links from donor confirmation emails exactly once per call log.
+
+    Opening a link only previews the answer; the donor records it with an explicit POST. The
+    first confirmation inserts an IdempotencyRecord for the call log before doing any work, so a
+    concurrent duplicate waits on the unique key and then reads the stored outcome. Every later
+    confirmation is answered from the cache, or from the record, without writing anything.
+    """
+
+    KEY_PREFIX = 'idempotency'
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'IDEMPOTENCY_CACHE_TIMEOUT', 86400)
+
+    @staticmethod
+    def key(call_log_id):
+        return f"confirm-donation:{call_log_id}"
+
+    @staticmethod
+    def _cache_key(key):
+        return f"{DonorConfirmationService.KEY_PREFIX}:{key}"
+
+    @staticmethod
+    def stored_result(key):
+        from .models import IdempotencyRecord
+
+        result = cache.get(DonorConfirmationService._cache_key(key))
+        if result is not None:
+            return result
+        record = IdempotencyRecord.objects.filter(key=key, status_code__isnull=False).values(
+            'response', 'status_code'
+        ).first()
+        if record is None:
+            return None
+        result = (record['response'], record['status_code'])
+        cache.set(DonorConfirmationService._cache_key(key), result, DonorConfirmationService.timeout())
+        return result
+
+    @staticmethod
+    def preview(call_log_id, response):
+        """What opening a link shows, without recording anything; returns (body, status_code).
+
+        Links are opened by mail scanners too, so only the explicit confirm step writes.
+        """
+        from .models import CallLog
+
+        result = DonorConfirmationService.stored_result(DonorConfirmationService.key(call_log_id))
+        if result is not None:
+            body, status_code = result
+            return dict(body, already_recorded=True), status_code
+
+        donor_name = CallLog.objects.filter(id=call_log_id).values_list('receiver__name', flat=True).first()
+        if donor_name is None:
+            return {"error": "Call log not found"}, 404
+
+        if response == 'yes':
+            message = f"Dear {donor_name}, please confirm that you agree to donate blood."
+        else:
+            message = f"Dear {donor_name}, please confirm that you cannot donate at this time."
+        return {
+            "success": True,
+            "confirmation_required": True,
+            "message": message,
+            "response": response,
+            "donor_name": donor_name,
+            "call_id": call_log_id
+        }, 200
+
+    @staticmethod
+    def confirm(call_log_id, response):
+        """Record the donor's answer for a call log once; returns (body, status_code)."""
+        from .models import IdempotencyRecord
+
+        key = DonorConfirmationService.key(call_log_id)
+        result = DonorConfirmationService.stored_result(key)
+        if result is not None:
+            return result
+
+        try:
+            with transaction.atomic():
+                record = IdempotencyRecord.objects.create(key=key)
+                body, status_code = DonorConfirmationService._process(call_log_id, response)
+                record.response = body
+                record.status_code = status_code
+                record.save(update_fields=['response', 'status_code'])
+        except IntegrityError:
+            result = DonorConfirmationService.stored_result(key)
+            if result is None:
+                raise
+            return result
+
+        cache.set(DonorConfirmationService._cache_key(key), (body, status_code), DonorConfirmationService.timeout())
+        return body, status_code
+
+    @staticmethod
+    def _process(call_log_id, response):
+        from .models import CallLog, MonthlyDonationTracker
+
+        try:
+            call_log = CallLog.objects.select_related('caller', 'receiver', 'donation_request').get(id=call_log_id)
+        except CallLog.DoesNotExist:
+            return {"error": "Call log not found"}, 404
+
+        now = timezone.now()
+        CallLog.objects.filter(id=call_log.id).update(
+            donor_email_response=response,
+            email_response_at=now,
+            updated_at=now
+        )
+
+        count_completed = False
+        if response == 'yes':
+            try:
+                completed_calls_count, _goal_completed, _completed_at, blocked = MonthlyDonationTracker.record_completed_call(
+                    call_log.caller_id
+                )
+                count_completed = True
+                if blocked:
+                    logger.info(f"User {call_log.caller.email} blocked after completing monthly goal")
+                logger.info(f"Count incremented for requester {call_log.caller.email}. New count: {completed_calls_count}")
+            except Exception as e:
+                logger.error(f"Error incrementing count: {str(e)}")
+
+            donation_request = call_log.donation_request
+            if donation_request is None:
+                logger.warning(f"Call {call_log.id} is not linked to a donation request - but count was still incremented")
+            elif donation_request.apply_transition('donor_confirm'):
+                logger.info(f"Updated donation request {donation_request.id} status to {donation_request.status}")
+
+            if count_completed:
+                message = f"Dear {call_log.receiver.name}, your generosity means the world to us! Your agreement to donate blood has been recorded and one count has been completed for the requester. You are truly a hero - your donation will save lives. We will contact you soon with donation details. Thank you for being an angel! "
+            else:
+                message = f"Dear {call_log.receiver.name}, thank you for agreeing to donate blood! Your response has been recorded. You are truly a hero - your donation will save lives. We will contact you soon with donation details."
+        else:
+            message = f"Thank you {call_log.receiver.name} for your response. We understand you cannot donate at this time."
+
+        logger.info(f"Donor {call_log.receiver.email} responded '{response}' to call {call_log.id}. Count completed: {count_completed}")
+
+        return {
+            "success": True,
+            "message": message,
+            "response": response,
+            "count_completed": count_completed,
+            "donor_name": call_log.receiver.name,
+            "call_id": call_log.id
+        }, 200
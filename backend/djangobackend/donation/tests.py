@@ -0,0 +1,41 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import User, DonationRequest
+
+
+class DonationRequestListQueryCountTests(TestCase):
+    """The request list must stay one query per page, however many rows it serializes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='me@example.com', name='Me', password='pw12345678')
+        others = [
+            User.objects.create_user(email=f'other{i}@example.com', name=f'Other {i}', password='pw12345678')
+            for i in range(5)
+        ]
+        requests = []
+        for i in range(60):
+            other = others[i % len(others)]
+            if i % 2:
+                requests.append(DonationRequest(requester=cls.user, donor=other, blood_group='A+'))
+            else:
+                requests.append(DonationRequest(requester=other, donor=cls.user, blood_group='O-'))
+        DonationRequest.objects.bulk_create(requests)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_page_in_one_query(self, limit):
+        with self.assertNumQueries(1):
+            response = self.client.get('/donation/donation-requests/', {'limit': limit})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['requests']), limit)
+        self.assertEqual({row['role'] for row in response.data['requests']}, {'requester', 'donor'})
+
+    def test_small_page_is_one_query(self):
+        self.assert_page_in_one_query(5)
+
+    def test_large_page_is_one_query(self):
+        self.assert_page_in_one_query(50)
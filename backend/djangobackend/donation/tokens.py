@@ -0,0 +1,129 @@
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+import threading
+import time
+
+
+class RevokedTokenIndex:
+    """In-process set of blacklisted refresh token JTIs, kept in sync with BlacklistedToken.
+
+    Every few seconds (TOKEN_BLACKLIST_SYNC_SECONDS) the set pulls the rows added since the last
+    sync with one id range query, and a full reload every TOKEN_BLACKLIST_RELOAD_SECONDS drops
+    expired tokens and picks up rows committed out of id order. Tokens blacklisted in this process
+    are added immediately by a post_save receiver. Checks themselves never touch the database.
+    """
+
+    _lock = threading.Lock()
+    _revoked = {}
+    _last_id = 0
+    _synced_at = None
+    _reloaded_at = None
+
+    @staticmethod
+    def sync_seconds():
+        return getattr(settings, 'TOKEN_BLACKLIST_SYNC_SECONDS', 5)
+
+    @staticmethod
+    def reload_seconds():
+        return getattr(settings, 'TOKEN_BLACKLIST_RELOAD_SECONDS', 600)
+
+    @classmethod
+    def _load(cls, since_id):
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        rows = BlacklistedToken.objects.filter(
+            id__gt=since_id,
+            token__expires_at__gt=timezone.now()
+        ).values_list('id', 'token__jti', 'token__expires_at')
+        revoked = {}
+        last_id = since_id
+        for row_id, jti, expires_at in rows:
+            revoked[jti] = expires_at
+            last_id = max(last_id, row_id)
+        return revoked, last_id
+
+    @classmethod
+    def sync(cls, force=False):
+        now = time.monotonic()
+        if not force and cls._synced_at is not None and now - cls._synced_at < cls.sync_seconds():
+            return
+
+        with cls._lock:
+            now = time.monotonic()
+            if not force and cls._synced_at is not None and now - cls._synced_at < cls.sync_seconds():
+                return
+
+            if force or cls._reloaded_at is None or now - cls._reloaded_at >= cls.reload_seconds():
+                cls._revoked, cls._last_id = cls._load(0)
+                cls._reloaded_at = now
+            else:
+                added, cls._last_id = cls._load(cls._last_id)
+                cls._revoked.update(added)
+            cls._synced_at = now
+
+    @classmethod
+    def contains(cls, jti):
+        cls.sync()
+        return jti in cls._revoked
+
+    @classmethod
+    def add(cls, jti, expires_at):
+        with cls._lock:
+            cls._revoked[jti] = expires_at
+
+    @classmethod
+    def size(cls):
+        return len(cls._revoked)
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """Refresh token whose blacklist check is a memory lookup in RevokedTokenIndex.
+
+    The index can lag other workers by a few seconds, so blacklisting stays authoritative: if the
+    BlacklistedToken row already exists the token was revoked elsewhere and is rejected.
+    """
+
+    def check_blacklist(self):
+        if RevokedTokenIndex.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        blacklisted, created = super().blacklist()
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+        return blacklisted, created
+
+
+class DonorConfirmationToken:
+    """Signed, expiring token carried by the yes/no links in donor confirmation emails.
+
+    The token binds the call log and the chosen answer, so links cannot be forged or edited;
+    single use is enforced by the idempotency record written when the link is first opened.
+    """
+
+    SALT = 'donation.confirm-donation'
+
+    @staticmethod
+    def max_age():
+        return getattr(settings, 'DONOR_CONFIRMATION_TOKEN_MAX_AGE', 14 * 24 * 3600)
+
+    @classmethod
+    def make(cls, call_log_id, response):
+        return signing.dumps({'call_log_id': call_log_id, 'response': response}, salt=cls.SALT, compress=True)
+
+    @classmethod
+    def read(cls, token):
+        """Return (call_log_id, response); raises signing.BadSignature for invalid or expired tokens."""
+        payload = signing.loads(token, salt=cls.SALT, max_age=cls.max_age())
+        try:
+            call_log_id = int(payload['call_log_id'])
+        except (KeyError, TypeError, ValueError):
+            raise signing.BadSignature('Malformed confirmation token')
+        if payload.get('response') not in ('yes', 'no'):
+            raise signing.BadSignature('Malformed confirmation token')
+        return call_log_id, payload['response']
@@ -20,6 +20,7 @@ urlpatterns = [
     path("admin/users/<int:pk>/block/", views.BlockUnblockUserView.as_view(), name="user-block-unblock"),
     path("admin/users/<int:pk>/revoke/", views.RevokeAccessView.as_view(), name="user-revoke"),
     path('admin/blocked-profiles/', views.BlockedProfilesView.as_view(), name='blocked_profiles'),
+    path('admin/donor-search/cache-stats/', views.DonorSearchCacheStatsView.as_view(), name='donor-search-cache-stats'),
     path('registration/create/', views.UserCreate.as_view(), name='registration-create'),
     path('send-otp/', views.send_otp, name='send-otp'),
     path('verify-otp/', views.VerifyOTPView.as_view(), name='verify-otp'),
@@ -1,23 +1,31 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
 from django.views import View
-from django.core.mail import send_mail
 from django.conf import settings
 from django.core.cache import cache
+from django.core import signing
 from django.utils.decorators import method_decorator
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from rest_framework.generics import CreateAPIView
 from rest_framework.views import APIView
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer, TemplateHTMLRenderer
 from rest_framework import status
 from django_ratelimit.decorators import ratelimit
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 import secrets
 import logging
+import datetime
+import csv
+import itertools
+import json
 from django.utils.decorators import method_decorator
 
-from .models import User, Profile, DonationRequest, CallLog, Admin, MonthlyDonationTracker
+from .models import User, Profile, DonationRequest, CallLog, Admin
 from .serializers import (
     UserSerializer,
     SendOTPSerializer,
@@ -28,8 +36,15 @@ from .serializers import (
     DonationRequestSerializer,
     CallLogSerializer,
     DonationRequestResponseSerializer,
+    DonationRequestListSerializer,
+    ArchivedDonationRequestListSerializer,
 )
-from .services import DonationRequestService
+from .tokens import CachedBlacklistRefreshToken, RevokedTokenIndex, DonorConfirmationToken
+from .services import (
+    DonationRequestService, DonorSearchService, DonorSearchCache, TrackerSnapshotCache, ActiveAdminCache,
+    KeysetPagination, UserListService, BlockedProfileService, DonorConfirmationService, parse_bool
+)
+from .email_config import EmailService
 
 logger = logging.getLogger(__name__)
 
@@ -53,33 +68,19 @@ def admin_required(view_func):
             return JsonResponse({"error": "Admin access required"}, status=403)
         
         try:
-            from rest_framework_simplejwt.tokens import UntypedToken
-            from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-            import jwt
-            from django.conf import settings
-            
-            token = auth_header.split(' ')[1]
-            UntypedToken(token) 
-            
-            decoded_token = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-            user_id = decoded_token.get('user_id')
-            is_admin = decoded_token.get('is_admin', False)
-            admin_id = decoded_token.get('admin_id')
-            if is_admin and admin_id:
-                try:
-                    admin = Admin.objects.get(id=admin_id, is_active=True)
-                    
-                    request.admin = admin
-                    return view_func(request, *args, **kwargs)
-                except Admin.DoesNotExist:
-                    return JsonResponse({"error": "Admin access required"}, status=403)
-            else:
-                return JsonResponse({"error": "Admin access required"}, status=403)
-                
-        except (InvalidToken, TokenError, jwt.DecodeError, jwt.ExpiredSignatureError):
+            # One signature/expiry check; the verified claims are read from the same token.
+            payload = UntypedToken(auth_header.split(' ')[1]).payload
+        except (InvalidToken, TokenError):
             return JsonResponse({"error": "Invalid or expired token"}, status=401)
-        except Exception as e:
+
+        admin_id = payload.get('admin_id')
+        if not payload.get('is_admin', False) or not admin_id or not ActiveAdminCache.is_active(admin_id):
             return JsonResponse({"error": "Admin access required"}, status=403)
+
+        request.admin_id = admin_id
+        # Only views that actually use the Admin row pay for loading it.
+        request.admin = SimpleLazyObject(lambda: Admin.objects.get(id=admin_id))
+        return view_func(request, *args, **kwargs)
         
     return _wrapped_view
 
@@ -227,7 +228,7 @@ class AdminLogoutView(View):
                             refresh_decoded = jwt.decode(refresh_token, settings.SECRET_KEY, algorithms=['HS256'])
                             jti = refresh_decoded.get('jti')
                             
-                            if jti:
+                            if jti and not RevokedTokenIndex.contains(jti):
                                 try:
                                     outstanding_token = OutstandingToken.objects.get(jti=jti)
                                     BlacklistedToken.objects.get_or_create(token=outstanding_token)
@@ -257,12 +258,10 @@ class AdminForgotPasswordView(View):
             otp = str(secrets.randbelow(900000) + 100000) 
             cache.set(f"admin_pw_reset_{email}", otp, timeout=600)  
             
-            send_mail(
+            EmailService.queue_email(
                 "Password Reset Code",
                 f"Your password reset code: {otp}",
-                settings.DEFAULT_FROM_EMAIL,
-                [email],
-                fail_silently=False
+                email
             )
             return JsonResponse({"message": "OTP sent to email"})
         except Admin.DoesNotExist:
@@ -332,13 +331,56 @@ class AdminResetPasswordView(View):
                 return JsonResponse({"error": "Admin account not found"}, status=404)
         return JsonResponse({"error": "Invalid or expired OTP"}, status=400)
 
+class _Echo:
+    """File-like object whose write() hands the line back, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _stream_rows(rows, fields, export_format, filename):
+    if export_format == 'csv':
+        writer = csv.writer(_Echo())
+        lines = itertools.chain(
+            [writer.writerow(fields)],
+            (writer.writerow([row[field] for field in fields]) for row in rows)
+        )
+        content_type = 'text/csv'
+    else:
+        lines = (json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows)
+        content_type = 'application/x-ndjson'
+
+    response = StreamingHttpResponse(lines, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+    return response
+
+
 class UserListView(View):
     @method_decorator([admin_required, ratelimit(key='ip', rate='60/m')])
     def get(self, request):
-        users = User.objects.filter(is_staff=False).values(
-            'id', 'email', 'name', 'is_active', 'is_verified', 'date_joined'
-        )
-        return JsonResponse({'users': list(users)})
+        try:
+            users = UserListService.filtered_queryset(request.GET)
+
+            export_format = request.GET.get('export')
+            if export_format:
+                if export_format not in UserListService.EXPORT_FORMATS:
+                    raise ValueError("export must be 'ndjson' or 'csv'")
+                return _stream_rows(
+                    UserListService.export_rows(users), list(UserListService.FIELDS), export_format, 'users'
+                )
+
+            limit = KeysetPagination.parse_limit(
+                request.GET.get('limit'), UserListService.DEFAULT_PAGE_SIZE, UserListService.MAX_PAGE_SIZE
+            )
+            rows, next_cursor = KeysetPagination.page(users, request.GET.get('cursor'), limit)
+            include_count = parse_bool(request.GET.get('include_count'), 'include_count')
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        data = {'users': rows, 'next_cursor': next_cursor, 'page_size': limit}
+        if include_count:
+            data['count'] = users.count()
+        return JsonResponse(data)
 
 class UserDeleteView(View):
     @method_decorator([admin_required, ratelimit(key='ip', rate='30/m')])
@@ -371,47 +413,38 @@ class BlockedProfilesView(View):
     def get(self, request):
     
         try:
-            from django.utils import timezone
-            
-            current_month = timezone.now().date().replace(day=1)
-             
-            blocked_trackers = MonthlyDonationTracker.objects.filter(
-                monthly_goal_completed=True,
-                completed_calls_count__gte=3,
-                
-            ).select_related('user').order_by('-goal_completed_at')
-            
-            blocked_profiles = []
-            for tracker in blocked_trackers:
-                user = tracker.user
-                
-                is_currently_blocked = not user.is_active
-                blocking_status = "Currently Blocked" if is_currently_blocked else "Previously Blocked (Unblocked)"
-                
-                blocked_profiles.append({
-                    'id': user.id,
-                    'email': user.email,
-                    'name': user.name,
-                    'is_active': user.is_active,
-                    'is_verified': user.is_verified,
-                    'date_joined': user.date_joined,
-                    'blocked_month': tracker.month,
-                    'completed_calls_count': tracker.completed_calls_count,
-                    'goal_completed_at': tracker.goal_completed_at,
-                    'monthly_goal_completed': tracker.monthly_goal_completed,
-                    'blocking_status': blocking_status,
-                    'is_current_month': tracker.month == current_month
-                })
-            
+            trackers = BlockedProfileService.filtered_queryset(request.GET)
+            limit = KeysetPagination.parse_limit(
+                request.GET.get('limit'), BlockedProfileService.DEFAULT_PAGE_SIZE, BlockedProfileService.MAX_PAGE_SIZE
+            )
+            # Newest trackers first, keyed on the tracker id so every page is an index range scan.
+            blocked_profiles, next_cursor = KeysetPagination.page(
+                trackers, request.GET.get('cursor'), limit, key='tracker_id', descending=True
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        try:
+            for profile in blocked_profiles:
+                # Clients address the user (block/delete actions), so 'id' stays the user id.
+                profile['id'] = profile.pop('user_id')
+
             return JsonResponse({
                 'blocked_profiles': blocked_profiles,
-                'total_count': len(blocked_profiles)
+                'next_cursor': next_cursor,
+                'page_size': limit,
+                'total_count': trackers.count()
             })
             
         except Exception as e:
             logger.error(f"Error fetching blocked profiles: {str(e)}")
             return JsonResponse({'error': 'Failed to fetch blocked profiles'}, status=500)
 
+class DonorSearchCacheStatsView(View):
+    @method_decorator([admin_required, ratelimit(key='ip', rate='60/m')])
+    def get(self, request):
+        return JsonResponse({'donor_search_cache': DonorSearchCache.stats()})
+
 class RevokeAccessView(View):
     @method_decorator([admin_required, ratelimit(key='ip', rate='30/m')])
     def post(self, request, pk):
@@ -451,12 +484,10 @@ class UserCreate(CreateAPIView):
             user = serializer.save()
             raw_otp = user.generate_otp()
             
-            send_mail(
+            EmailService.queue_email(
                 "Email Verification Required",
                 f"Your email verification code: {raw_otp}",
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False
+                user.email
             )
             
             return Response(
@@ -492,12 +523,10 @@ def send_otp(request):
     try:
         raw_otp = user.generate_otp()  
         
-        send_mail(
+        EmailService.queue_email(
             "Email Verification Required",
             f"Your email verification code: {raw_otp}",
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False
+            user.email
         )
         
         return Response(
@@ -562,12 +591,10 @@ class UserForgotPasswordView(APIView):
             otp = str(secrets.randbelow(900000) + 100000)  
             cache.set(f"user_pw_reset_{email}", otp, timeout=600)  
         
-            send_mail(
+            EmailService.queue_email(
                 "Password Reset Code",
                 f"Your password reset code: {otp}. This OTP will expire in 10 minutes.",
-                settings.DEFAULT_FROM_EMAIL,
-                [email],
-                fail_silently=False
+                email
             )
             return Response({"message": "OTP sent to your email"}, status=status.HTTP_200_OK)
         except User.DoesNotExist:
@@ -665,7 +692,7 @@ class LogoutView(APIView):
                 )
             
             
-            token = RefreshToken(refresh_token)
+            token = CachedBlacklistRefreshToken(refresh_token)
             token.blacklist()
             
             return Response(
@@ -774,6 +801,7 @@ class DonorSearchView(APIView):
         try:
             blood_group = request.GET.get('blood_group')
             city = request.GET.get('city')
+            mode = request.GET.get('mode', 'exact')
             
             if not blood_group or not city:
                 return Response(
@@ -781,23 +809,54 @@ class DonorSearchView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
             
-            donor_profiles = Profile.objects.filter(
-                blood_group=blood_group,
-                city=city,
-                role='donor'
-            ).select_related('user')
+            # An unencoded '+' in the query string arrives as a space.
+            blood_group = blood_group.replace(' ', '+').strip()
+            
+            if mode not in DonorSearchService.SEARCH_MODES:
+                return Response(
+                    {"error": "mode must be 'exact' or 'compatible'"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             
+            if mode == 'compatible' and not DonorSearchService.compatible_donor_groups(blood_group):
+                return Response(
+                    {"error": f"Unknown blood group: {blood_group}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             
-            serializer = ProfileSerializer(donor_profiles, many=True)
+            try:
+                fields = DonorSearchService.parse_fields(request.GET.get('fields'))
+                limit = DonorSearchService.parse_page_size(request.GET.get('limit'))
+                donors, next_cursor = DonorSearchService.search_page(
+                    blood_group,
+                    city,
+                    mode=mode,
+                    fields=fields,
+                    cursor=request.GET.get('cursor'),
+                    limit=limit,
+                    requester=request.user if request.user.is_authenticated else None
+                )
+            except ValueError as e:
+                return Response(
+                    {"error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             
             return Response(
                 {
                     "success": True,
-                    "message": f"Found {len(serializer.data)} donors",
-                    "donors": serializer.data,
+                    "message": f"Found {len(donors)} donors",
+                    "donors": donors,
+                    "next_cursor": next_cursor,
+                    "page_size": limit,
                     "search_criteria": {
                         "blood_group": blood_group,
-                        "city": city
+                        "city": city,
+                        "mode": mode,
+                        "donor_blood_groups": list(
+                            DonorSearchService.compatible_donor_groups(blood_group)
+                            if mode == 'compatible' else (blood_group,)
+                        )
                     }
                 },
                 status=status.HTTP_200_OK,
@@ -848,17 +907,51 @@ class DonationRequestListView(APIView):
     def get(self, request):
         try:
             user = request.user
-            requests_made = DonationRequest.objects.filter(requester=user)
-            requests_received = DonationRequest.objects.filter(donor=user)
-            
-            made_serializer = DonationRequestSerializer(requests_made, many=True)
-            received_serializer = DonationRequestSerializer(requests_received, many=True)
+            if not user.is_authenticated:
+                return Response(
+                    {"error": "Authentication required"},
+                    status=status.HTTP_401_UNAUTHORIZED
+                )
+
+            role = request.GET.get('role')
+            if role and role not in DonationRequestService.LIST_ROLES:
+                return Response(
+                    {"error": "role must be 'requester' or 'donor'"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                statuses = DonationRequestService.parse_statuses(request.GET.get('status'))
+                include_history = parse_bool(request.GET.get('history'), 'history')
+                limit = KeysetPagination.parse_limit(
+                    request.GET.get('limit'), DonationRequestService.DEFAULT_PAGE_SIZE, DonationRequestService.MAX_PAGE_SIZE
+                )
+                querysets = [DonationRequestService.list_queryset(user, statuses=statuses, role=role)]
+                if include_history:
+                    querysets.append(
+                        DonationRequestService.list_queryset(user, statuses=statuses, role=role, archived=True)
+                    )
+                donation_requests, next_cursor = KeysetPagination.page_merged(
+                    querysets,
+                    request.GET.get('cursor'),
+                    limit,
+                    descending=True
+                )
+            except ValueError as e:
+                return Response(
+                    {"error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
             return Response(
                 {
                     "success": True,
-                    "requests_made": made_serializer.data,
-                    "requests_received": received_serializer.data
+                    "requests": [
+                        (ArchivedDonationRequestListSerializer if row.archived else DonationRequestListSerializer)(row).data
+                        for row in donation_requests
+                    ],
+                    "next_cursor": next_cursor,
+                    "page_size": limit
                 },
                 status=status.HTTP_200_OK
             )
@@ -891,12 +984,18 @@ class DonationRequestResponseView(APIView):
                 notes = serializer.validated_data.get('notes', '')
              
                 if user == donation_request.requester:
-                    donation_request.user_response = response
-                     
-                elif user == donation_request.donor:
-                    donation_request.donor_response = response
+                    event = 'requester_accept' if response else 'requester_decline'
+                else:
+                    event = 'donor_accept' if response else 'donor_decline'
             
-                donation_request.update_status()
+                if not donation_request.apply_transition(event, actor=user):
+                    return Response(
+                        {
+                            "error": f"Cannot respond to a request that is {donation_request.get_status_display().lower()}",
+                            "status": donation_request.status
+                        },
+                        status=status.HTTP_409_CONFLICT
+                    )
                 
                 return Response(
                     {
@@ -968,36 +1067,41 @@ class MonthlyTrackerView(APIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            try:
-                user = User.objects.get(email=user_email)
-                logger.info(f"Found user for monthly tracker: {user.email}")
-            except User.DoesNotExist:
-                logger.warning(f"User not found for monthly tracker: {user_email}")
-                return Response(
-                    {"error": "User not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                ) 
-            from .models import MonthlyDonationTracker
-            try:
-                tracker, created = MonthlyDonationTracker.get_or_create_for_user_month(user)
-                logger.info(f"Monthly tracker {'created' if created else 'retrieved'} for user {user.email}")
-            except Exception as tracker_error:
-                logger.error(f"Error creating/retrieving monthly tracker for {user.email}: {str(tracker_error)}")
-                return Response(
-                    {"error": "Failed to retrieve monthly tracker data"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            snapshot = TrackerSnapshotCache.get_by_email(user_email)
+            if snapshot is None:
+                try:
+                    user = User.objects.get(email=user_email)
+                    logger.info(f"Found user for monthly tracker: {user.email}")
+                except User.DoesNotExist:
+                    logger.warning(f"User not found for monthly tracker: {user_email}")
+                    return Response(
+                        {"error": "User not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    ) 
+                try:
+                    snapshot = TrackerSnapshotCache.load(user)
+                except Exception as tracker_error:
+                    logger.error(f"Error retrieving monthly tracker for {user.email}: {str(tracker_error)}")
+                    return Response(
+                        {"error": "Failed to retrieve monthly tracker data"},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+
+            headers = {"ETag": snapshot['etag']}
+            if request.headers.get('If-None-Match') == snapshot['etag']:
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
             response_data = {
-                "user_email": user.email,
-                "month": tracker.month.strftime('%B %Y'),
-                "completed_calls_count": tracker.completed_calls_count,
-                "monthly_goal_completed": tracker.monthly_goal_completed,
-                "goal_completed_at": tracker.goal_completed_at,
-                "progress": f"{tracker.completed_calls_count}/3"
+                "user_email": snapshot['user_email'],
+                "month": datetime.date.fromisoformat(snapshot['month']).strftime('%B %Y'),
+                "completed_calls_count": snapshot['completed_calls_count'],
+                "monthly_goal_completed": snapshot['monthly_goal_completed'],
+                "goal_completed_at": snapshot['goal_completed_at'],
+                "progress": f"{snapshot['completed_calls_count']}/3"
             }
             
-            logger.info(f"Monthly tracker response for {user.email}: {response_data}")
-            return Response(response_data, status=status.HTTP_200_OK)
+            logger.info(f"Monthly tracker response for {snapshot['user_email']}: {response_data}")
+            return Response(response_data, status=status.HTTP_200_OK, headers=headers)
 
         except Exception as e:
             logger.error(f"Unexpected error getting monthly tracker: {str(e)}")
@@ -1028,48 +1132,54 @@ class DonorTrackerView(APIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            try:
-                user = User.objects.get(id=user_id)
-                logger.info(f"Found user for donor tracker: {user.email}")
-            except User.DoesNotExist:
-                logger.warning(f"User not found for donor tracker: {user_id}")
-                return Response(
-                    {"error": "User not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-            except ValueError:
-                logger.warning(f"Invalid user_id format: {user_id}")
-                return Response(
-                    {
-                        "error": "Invalid user_id format",
-                        "details": "user_id must be a valid integer"
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            from .models import MonthlyDonationTracker
-            try:
-                tracker, created = MonthlyDonationTracker.get_or_create_for_user_month(user)
-                logger.info(f"Monthly tracker {'created' if created else 'retrieved'} for user {user.email}")
-            except Exception as tracker_error:
-                logger.error(f"Error creating/retrieving monthly tracker for user {user.email}: {str(tracker_error)}")
-                return Response(
-                    {"error": "Failed to retrieve monthly tracker data"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            snapshot = TrackerSnapshotCache.get(user_id)
+            if snapshot is None:
+                try:
+                    user = User.objects.get(id=user_id)
+                    logger.info(f"Found user for donor tracker: {user.email}")
+                except User.DoesNotExist:
+                    logger.warning(f"User not found for donor tracker: {user_id}")
+                    return Response(
+                        {"error": "User not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+                except ValueError:
+                    logger.warning(f"Invalid user_id format: {user_id}")
+                    return Response(
+                        {
+                            "error": "Invalid user_id format",
+                            "details": "user_id must be a valid integer"
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                try:
+                    snapshot = TrackerSnapshotCache.load(user)
+                except Exception as tracker_error:
+                    logger.error(f"Error retrieving monthly tracker for user {user.email}: {str(tracker_error)}")
+                    return Response(
+                        {"error": "Failed to retrieve monthly tracker data"},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+
+            headers = {"ETag": snapshot['etag']}
+            if request.headers.get('If-None-Match') == snapshot['etag']:
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            completed_calls_count = snapshot['completed_calls_count']
             response_data = {
-                "user_id": user.id,
-                "user_email": user.email,
-                "month": tracker.month.strftime('%B %Y'),
-                "completed_calls_count": tracker.completed_calls_count,
-                "monthly_goal_completed": tracker.monthly_goal_completed,
-                "goal_completed_at": tracker.goal_completed_at.isoformat() if tracker.goal_completed_at else None,
-                "progress": f"{tracker.completed_calls_count}/3",
-                "progress_percentage": min(100, (tracker.completed_calls_count / 3) * 100),
-                "calls_remaining": max(0, 3 - tracker.completed_calls_count)
+                "user_id": snapshot['user_id'],
+                "user_email": snapshot['user_email'],
+                "month": datetime.date.fromisoformat(snapshot['month']).strftime('%B %Y'),
+                "completed_calls_count": completed_calls_count,
+                "monthly_goal_completed": snapshot['monthly_goal_completed'],
+                "goal_completed_at": snapshot['goal_completed_at'],
+                "progress": f"{completed_calls_count}/3",
+                "progress_percentage": min(100, (completed_calls_count / 3) * 100),
+                "calls_remaining": max(0, 3 - completed_calls_count)
             }
             
-            logger.info(f"Donor tracker response for user {user.email}: {response_data}")
-            return Response(response_data, status=status.HTTP_200_OK)
+            logger.info(f"Donor tracker response for user {snapshot['user_email']}: {response_data}")
+            return Response(response_data, status=status.HTTP_200_OK, headers=headers)
             
         except Exception as e:
             logger.error(f"Unexpected error getting donor tracker: {str(e)}")
@@ -1099,15 +1209,20 @@ class DonorResponseView(APIView):
                     {"error": "Donation request not found"},
                     status=status.HTTP_404_NOT_FOUND
                 )
-            donation_request.donor_response = donor_response == 'yes'
-            donation_request.response_date = timezone.now()
-            donation_request.update_status()
-            donation_request.save()
+            event = 'donor_accept' if donor_response == 'yes' else 'donor_decline'
+            if not donation_request.apply_transition(event):
+                return Response(
+                    {
+                        "error": f"Cannot respond to a request that is {donation_request.get_status_display().lower()}",
+                        "status": donation_request.status
+                    },
+                    status=status.HTTP_409_CONFLICT
+                )
             try:
                 success, message = DonationRequestService.send_response_notification(
-                    donor_user=donation_request.donor,
-                    caller_user=donation_request.requester,
-                    request_id=request_id
+                    donation_request=donation_request,
+                    response=donor_response == 'yes',
+                    notes=''
                 )
                 
                 if not success:
@@ -1151,13 +1266,16 @@ class DonorResponseView(APIView):
                 {"error": "Donation request not found"},
                 status=status.HTTP_404_NOT_FOUND
             )
-        donor_agreed = response == 'yes'
-        donation_request.donor_response = donor_agreed
-        donation_request.update_status()
-        donation_request.save()
-        if donation_request.user_response is True and donation_request.donor_response is True:
-            donation_request.status = 'completed'
-            donation_request.save()
+        event = 'donor_confirm' if response == 'yes' else 'donor_decline'
+        if not donation_request.apply_transition(event):
+            return Response(
+                {
+                    "error": f"This request is already {donation_request.get_status_display().lower()}",
+                    "status": donation_request.status
+                },
+                status=status.HTTP_409_CONFLICT
+            )
+        if donation_request.status == 'completed':
             message = f"Thank you! Your response has been recorded. Both parties have agreed."
         else:
             message = f"Thank you for your response. You have responded '{response.upper()}' to the blood donation request."
@@ -1206,7 +1324,6 @@ class SendDonorNotificationView(APIView):
     def post(self, request):
         
         try:
-            from .email_config import EmailService
             from django.utils import timezone
             
             call_log_id = request.data.get('call_log_id')
@@ -1278,11 +1395,15 @@ class SendDonorNotificationView(APIView):
 
 class DonorEmailConfirmationView(APIView):
     permission_classes = [AllowAny]
+    # Donors open the emailed link in a browser, so this view can also answer with HTML.
+    renderer_classes = [JSONRenderer, TemplateHTMLRenderer]
+    template_name = 'donation/confirm_donation.html'
     
     @method_decorator(ratelimit(key='ip', rate='10/m'))
     def post(self, request):
+        if 'token' in request.data:
+            return self.confirm_token(request, request.data.get('token'))
         try:
-            from .email_config import EmailService
             from django.utils import timezone
             donor_id = request.data.get('donor_id')
             caller_id = request.data.get('caller_id')
@@ -1391,99 +1512,27 @@ class DonorEmailConfirmationView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    @method_decorator(ratelimit(key='ip', rate='20/m'))
-    def get(self, request):
-        try:
-            call_log_id = request.GET.get('call_log_id')
-            response = request.GET.get('response')
-            
-            if not call_log_id or not response:
-                return Response(
-                    {"error": "Missing call_log_id or response parameter"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            if response not in ['yes', 'no']:
-                return Response(
-                    {"error": "Invalid response. Must be 'yes' or 'no'"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+    @staticmethod
+    def _token_response(request, token, handle):
+        """Read the signed link token and answer with handle(call_log_id, response).
+
+        Browsers opening the email link get the HTML page in template_name; the app gets JSON.
+        """
+        if not token:
+            body, status_code = {"error": "Missing confirmation token"}, status.HTTP_400_BAD_REQUEST
+        else:
             try:
-                call_log = CallLog.objects.get(id=call_log_id)
-            except CallLog.DoesNotExist:
-                return Response(
-                    {"error": "Call log not found"},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            call_log.donor_response = response
-            call_log.save()
-            
-            count_completed = False
-            
-            if response == 'yes':
-                    try:
-                        from .models import MonthlyDonationTracker
-                        tracker, created = MonthlyDonationTracker.get_or_create_for_user_month(
-                            user=call_log.caller
-                        )
-                        goal_completed = tracker.increment_call_count()
-                        count_completed = True
-                        
-                
-                        if (tracker.completed_calls_count >= 3 and 
-                            call_log.caller.is_active and 
-                            not getattr(call_log.caller, 'manual_block_override', False)):
-                            call_log.caller.is_active = False
-                            call_log.caller.save()
-                            
-                            logger.info(f"User {call_log.caller.email} blocked after completing monthly goal")
-                            
-            
-                        logger.info(f"Count incremented for requester {call_log.caller.email}. New count: {tracker.completed_calls_count}")
-                    except Exception as e:
-                        logger.error(f"Error incrementing count: {str(e)}")
-        
-            if response == 'yes':
-                try:
-                    donation_request = DonationRequest.objects.get(
-                        requester=call_log.requester,
-                        donor=call_log.receiver,
-                        user_response=True  
-                    )
-                    if donation_request.status == 'pending':
-                        donation_request.donor_response = True
-                        donation_request.status = 'both_accepted'
-                        donation_request.save()
-                        logger.info(f"Updated donation request {donation_request.id} status to both_accepted")
-                    elif donation_request.status == 'user_accepted':
-                        donation_request.donor_response = True
-                        donation_request.status = 'completed'
-                        donation_request.save()
-                        logger.info(f"Updated donation request {donation_request.id} status to completed")
-                        
-                except DonationRequest.DoesNotExist:
-                    logger.warning(f"No matching donation request found for call {call_log.id} - but count was still incremented")
-            
-            
-            if response == 'yes':
-                if count_completed:
-                    message = f"Dear {call_log.receiver.name}, your generosity means the world to us! Your agreement to donate blood has been recorded and one count has been completed for the requester. You are truly a hero - your donation will save lives. We will contact you soon with donation details. Thank you for being an angel! "
-                else:
-                    message = f"Dear {call_log.receiver.name}, thank you for agreeing to donate blood! Your response has been recorded. You are truly a hero - your donation will save lives. We will contact you soon with donation details."
+                call_log_id, response = DonorConfirmationToken.read(token)
+            except signing.BadSignature:
+                body, status_code = {"error": "This confirmation link is invalid or has expired"}, status.HTTP_400_BAD_REQUEST
             else:
-                message = f"Thank you {call_log.receiver.name} for your response. We understand you cannot donate at this time."
-            
-            logger.info(f"Donor {call_log.receiver.email} responded '{response}' to call {call_log.id}. Count completed: {count_completed}")
-            
-            return Response({
-                "success": True,
-                "message": message,
-                "response": response,
-                "count_completed": count_completed,
-                "donor_name": call_log.receiver.name,
-                "call_id": call_log.id
-            }, status=status.HTTP_200_OK)
-            
+                body, status_code = handle(call_log_id, response)
+
+        return Response(body, status=status_code)
+
+    def confirm_token(self, request, token):
+        try:
+            return self._token_response(request, token, DonorConfirmationService.confirm)
         except Exception as e:
             logger.error(f"Error processing email confirmation: {str(e)}")
             return Response(
@@ -1491,6 +1540,18 @@ class DonorEmailConfirmationView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @method_decorator(ratelimit(key='ip', rate='20/m'))
+    def get(self, request):
+        # Only a preview: mail scanners fetch links, so the answer is recorded by POST.
+        try:
+            return self._token_response(request, request.GET.get('token'), DonorConfirmationService.preview)
+        except Exception as e:
+            logger.error(f"Error previewing email confirmation: {str(e)}")
+            return Response(
+                {"error": "An error occurred while processing confirmation"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
 class ProfileRedirectView(APIView):
     permission_classes = [AllowAny]
 
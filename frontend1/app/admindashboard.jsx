@@ -8,7 +8,7 @@ import api from "../constants/API";
 export default function AdminDashboard() {
   const router = useRouter();
   const [adminInfo, setAdminInfo] = useState(null);
-  const [users, setUsers] = useState([]);
+  const [blockedCount, setBlockedCount] = useState(0);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -48,10 +48,15 @@ export default function AdminDashboard() {
         headers: {
           Authorization: `Bearer ${token}`,
         },
+        params: {
+          is_active: false,
+          limit: 1,
+          include_count: true,
+        },
       });
 
       if (response.status === 200) {
-        setUsers(response.data.users || []);
+        setBlockedCount(response.data.count || 0);
       }
     } catch (error) {
       console.error("Load users error:", error);
@@ -143,7 +148,7 @@ export default function AdminDashboard() {
           onPress={() => router.push("/blockedprofiles")}
         >
           <Ionicons name="ban-outline" size={32} color="#fff" />
-          <Text style={styles.blockedProfilesNumber}>{users.filter(u => !u.is_active).length}</Text>
+          <Text style={styles.blockedProfilesNumber}>{blockedCount}</Text>
           <Text style={styles.blockedProfilesLabel}>Blocked Profiles</Text>
         </TouchableOpacity>
       </View>
@@ -8,25 +8,39 @@ import api from "../constants/API";
 export default function BlockedProfiles() {
   const router = useRouter();
   const [blockedUsers, setBlockedUsers] = useState([]);
+  const [totalCount, setTotalCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
+  const [currentOnly, setCurrentOnly] = useState(false);
 
   useEffect(() => {
     loadBlockedUsers();
-  }, []);
+  }, [currentOnly]);
+
+  const fetchBlockedPage = async (cursor) => {
+    const token = await AsyncStorage.getItem("authToken");
+    return api.get("/donation/admin/blocked-profiles/", {
+      headers: {
+        Authorization: `Bearer ${token}`,
+      },
+      params: {
+        currently_blocked: currentOnly ? true : undefined,
+        cursor: cursor || undefined,
+      },
+    });
+  };
 
   const loadBlockedUsers = async () => {
     try {
-      const token = await AsyncStorage.getItem("authToken");
-      const response = await api.get("/donation/admin/blocked-profiles/", {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+      const response = await fetchBlockedPage(null);
   
       if (response.status === 200) {
         
         setBlockedUsers(response.data.blocked_profiles);
+        setTotalCount(response.data.total_count);
+        setNextCursor(response.data.next_cursor || null);
       }
     } catch (error) {
       console.error("Load blocked users error:", error);
@@ -37,6 +51,29 @@ export default function BlockedProfiles() {
     }
   };
 
+  const loadMoreBlockedUsers = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const response = await fetchBlockedPage(nextCursor);
+      if (response.status === 200) {
+        setBlockedUsers((previous) => [...previous, ...response.data.blocked_profiles]);
+        setNextCursor(response.data.next_cursor || null);
+      }
+    } catch (error) {
+      console.error("Load more blocked users error:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const handleScroll = ({ nativeEvent }) => {
+    const { layoutMeasurement, contentOffset, contentSize } = nativeEvent;
+    if (layoutMeasurement.height + contentOffset.y >= contentSize.height - 200) {
+      loadMoreBlockedUsers();
+    }
+  };
+
   const onRefresh = () => {
     setRefreshing(true);
     loadBlockedUsers();
@@ -148,31 +185,52 @@ export default function BlockedProfiles() {
 
       
       <View style={styles.content}>
+        <View style={styles.filterRow}>
+          <TouchableOpacity
+            style={[styles.filterBtn, !currentOnly && styles.filterBtnActive]}
+            onPress={() => setCurrentOnly(false)}
+          >
+            <Text style={[styles.filterText, !currentOnly && styles.filterTextActive]}>All</Text>
+          </TouchableOpacity>
+          <TouchableOpacity
+            style={[styles.filterBtn, currentOnly && styles.filterBtnActive]}
+            onPress={() => setCurrentOnly(true)}
+          >
+            <Text style={[styles.filterText, currentOnly && styles.filterTextActive]}>Currently Blocked</Text>
+          </TouchableOpacity>
+        </View>
+
         {blockedUsers.length === 0 ? (
           <View style={styles.emptyContainer}>
             <Ionicons name="ban-outline" size={80} color="#ccc" />
             <Text style={styles.emptyText}>No blocked users found</Text>
-            <Text style={styles.emptySubtext}>All users are currently active</Text>
+            <Text style={styles.emptySubtext}>
+              {currentOnly ? "All users are currently active" : "No user has been blocked yet"}
+            </Text>
           </View>
         ) : (
           <>
             <View style={styles.statsHeader}>
               <Text style={styles.statsText}>
-                {blockedUsers.length} blocked user{blockedUsers.length !== 1 ? 's' : ''}
+                {totalCount} {currentOnly ? "currently blocked" : "blocked"} profile{totalCount !== 1 ? 's' : ''}
               </Text>
             </View>
             
             <ScrollView
               style={styles.usersList}
               refreshControl={<RefreshControl refreshing={refreshing} onRefresh={onRefresh} />}
+              onScroll={handleScroll}
+              scrollEventThrottle={400}
             >
               {blockedUsers.map((user) => (
-                <View key={user.id} style={styles.userCard}>
+                <View key={user.tracker_id} style={styles.userCard}>
                   <View style={styles.userInfo}>
                     <Text style={styles.userName}>{user.name}</Text>
                     <Text style={styles.userEmail}>{user.email}</Text>
                     <View style={styles.userStatus}>
-                      <Text style={styles.blockedBadge}>Blocked</Text>
+                      <Text style={[styles.blockedBadge, user.is_active && styles.previouslyBlockedBadge]}>
+                        {user.is_active ? "Previously Blocked (Unblocked)" : "Blocked"}
+                      </Text>
                       <Text style={[styles.statusBadge, user.is_verified ? styles.verifiedBadge : styles.unverifiedBadge]}>
                         {user.is_verified ? "Verified" : "Unverified"}
                       </Text>
@@ -331,6 +389,34 @@ const styles = StyleSheet.create({
     color: "#fff",
     fontWeight: "bold",
   },
+  previouslyBlockedBadge: {
+    backgroundColor: "#9E9E9E",
+  },
+  filterRow: {
+    flexDirection: "row",
+    gap: 10,
+    marginBottom: 15,
+  },
+  filterBtn: {
+    flex: 1,
+    paddingVertical: 10,
+    borderRadius: 8,
+    borderWidth: 1,
+    borderColor: "#d40000",
+    backgroundColor: "#fff",
+    alignItems: "center",
+  },
+  filterBtnActive: {
+    backgroundColor: "#d40000",
+  },
+  filterText: {
+    fontSize: 14,
+    fontWeight: "bold",
+    color: "#d40000",
+  },
+  filterTextActive: {
+    color: "#fff",
+  },
   verifiedBadge: {
     backgroundColor: "#2196F3",
   },
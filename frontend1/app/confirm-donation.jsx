@@ -1,42 +1,66 @@
 import React, { useEffect, useState } from 'react';
-import {  View, Text, StyleSheet, ActivityIndicator} from 'react-native';
+import {  View, Text, StyleSheet, ActivityIndicator, TouchableOpacity} from 'react-native';
 import { useLocalSearchParams } from 'expo-router';
 import api from '../constants/API';
 
 export default function ConfirmDonationScreen() {
-  const { call_id, response } = useLocalSearchParams();
+  const { token } = useLocalSearchParams();
   const [loading, setLoading] = useState(true);
   const [message, setMessage] = useState('');
   const [success, setSuccess] = useState(false);
+  const [pendingResponse, setPendingResponse] = useState(null);
 
   useEffect(() => {
-    if (call_id && response) {
-      handleConfirmation();
+    if (token) {
+      loadConfirmation();
     } else {
       setMessage('Invalid confirmation link');
       setLoading(false);
     }
-  }, [call_id, response]);
+  }, [token]);
 
-  const handleConfirmation = async () => {
+  const showResult = (data) => {
+    if (data.success) {
+      setSuccess(true);
+      setMessage(data.message || 'Thank you for your response!');
+    } else {
+      setMessage(data.message || 'Failed to process confirmation');
+    }
+  };
+
+  const loadConfirmation = async () => {
     try {
       setLoading(true);
       
-    
+      // Opening the link only previews it; the answer is recorded when the donor confirms.
       const apiResponse = await api.get(
-        `/donation/confirm-donation/?call_log_id=${call_id}&response=${response}`
+        `/donation/confirm-donation/?token=${encodeURIComponent(token)}`
       );
       
-      if (apiResponse.data.success) {
-        setSuccess(true);
-  
-        setMessage(apiResponse.data.message || 'Thank you for your response!');
+      if (apiResponse.data.confirmation_required) {
+        setPendingResponse(apiResponse.data.response);
+        setMessage(apiResponse.data.message);
       } else {
-        setMessage(apiResponse.data.message || 'Failed to process confirmation');
+        showResult(apiResponse.data);
       }
     } catch (error) {
       console.error('Confirmation error:', error);
-      setMessage('Failed to process your confirmation. Please try again later.');
+      setMessage(error.response?.data?.error || 'Failed to load your confirmation. Please try again later.');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const handleConfirmation = async () => {
+    try {
+      setLoading(true);
+      setPendingResponse(null);
+      
+      const apiResponse = await api.post('/donation/confirm-donation/', { token });
+      showResult(apiResponse.data);
+    } catch (error) {
+      console.error('Confirmation error:', error);
+      setMessage(error.response?.data?.error || 'Failed to process your confirmation. Please try again later.');
     } finally {
       setLoading(false);
     }
@@ -54,9 +78,16 @@ export default function ConfirmDonationScreen() {
           </View>
         ) : (
           <View style={styles.messageContainer}>
-            <Text style={[styles.message, success ? styles.successMessage : styles.errorMessage]}>
+            <Text style={[styles.message, pendingResponse ? styles.promptMessage : success ? styles.successMessage : styles.errorMessage]}>
               {message}
             </Text>
+            {pendingResponse && (
+              <TouchableOpacity style={styles.confirmButton} onPress={handleConfirmation}>
+                <Text style={styles.confirmButtonText}>
+                  {pendingResponse === 'yes' ? 'Yes, I can donate' : 'No, I cannot donate'}
+                </Text>
+              </TouchableOpacity>
+            )}
           </View>
         )}
       </View>
@@ -104,4 +135,19 @@ const styles = StyleSheet.create({
   errorMessage: {
     color: '#dc3545',
   },
+  promptMessage: {
+    color: '#333',
+  },
+  confirmButton: {
+    marginTop: 20,
+    backgroundColor: '#d40000',
+    paddingVertical: 12,
+    paddingHorizontal: 28,
+    borderRadius: 8,
+  },
+  confirmButtonText: {
+    color: '#fff',
+    fontSize: 16,
+    fontWeight: 'bold',
+  },
 });
\ No newline at end of file
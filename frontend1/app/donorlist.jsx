@@ -7,6 +7,8 @@ export default function DonorListScreen() {
   const { bloodGroup, city } = useLocalSearchParams();
   const [donors, setDonors] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchDonors();
@@ -28,6 +30,7 @@ export default function DonorListScreen() {
       
       if (response && response.data) {
         setDonors(response.data.donors || []);
+        setNextCursor(response.data.next_cursor || null);
       } else {
         console.error('Invalid response structure:', response);
         setDonors([]);
@@ -41,6 +44,28 @@ export default function DonorListScreen() {
     }
   };
 
+  const fetchMoreDonors = async () => {
+    if (!nextCursor || loadingMore) {
+      return;
+    }
+    try {
+      setLoadingMore(true);
+      const response = await api.get('/donation/donors/search/', {
+        params: {
+          blood_group: bloodGroup,
+          city: city,
+          cursor: nextCursor
+        }
+      });
+      setDonors((current) => [...current, ...(response.data.donors || [])]);
+      setNextCursor(response.data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching more donors:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const renderDonorItem = ({ item }) => (
     <TouchableOpacity 
       style={styles.donorCard}
@@ -120,6 +145,9 @@ export default function DonorListScreen() {
           keyExtractor={(item) => item.id.toString()}
           contentContainerStyle={styles.listContainer}
           showsVerticalScrollIndicator={false}
+          onEndReached={fetchMoreDonors}
+          onEndReachedThreshold={0.5}
+          ListFooterComponent={loadingMore ? <ActivityIndicator size="small" color="#d40000" /> : null}
         />
       )}
     </View>
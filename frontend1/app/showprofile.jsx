@@ -93,6 +93,7 @@ export default function ShowProfileScreen() {
 
       const callData = {
         receiver: donor.user, 
+        donation_request: donationRequestId,
         call_start_time: callStartTime,
         call_end_time: new Date().toISOString(),
       };